@@ -0,0 +1,67 @@
+"""song_metadata.csv 가져오기(import_metadata_csv) 속도 측정.
+
+빈 DB에 처음 가져올 때와, 같은 CSV를 이미 가져온 DB에 다시 가져올 때
+(내용이 같은 행은 건너뜀) 걸리는 시간을 비교합니다.
+
+사용법: python bench_metadata_import.py [CSV 경로] [반복 횟수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from viewer12 import (
+    ensure_lyrics_fts,
+    import_metadata_csv,
+    migrate_path_key,
+    open_metadata_connection,
+)
+
+
+def create_schema(con):
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS song_metadata (
+            file_path TEXT PRIMARY KEY,
+            song_key TEXT,
+            lyrics TEXT,
+            updated_at TEXT,
+            updated_by TEXT,
+            dirty INTEGER DEFAULT 0
+        )
+        """
+    )
+    migrate_path_key(con)
+    con.commit()
+    ensure_lyrics_fts(con)
+
+
+def timed_import(con, csv_path):
+    start = time.perf_counter()
+    result = import_metadata_csv(con, csv_path, "")
+    return time.perf_counter() - start, result.applied, result.skipped
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(here, "song_metadata.csv")
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    print(f"CSV: {csv_path} ({os.path.getsize(csv_path) / 1024:.0f} KB)")
+
+    for run in range(1, repeat + 1):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            con = open_metadata_connection(os.path.join(tmp_dir, "bench.db"))
+            create_schema(con)
+            fresh = timed_import(con, csv_path)
+            populated = timed_import(con, csv_path)
+            con.close()
+        print(
+            f"[{run}] 빈 DB: {fresh[0] * 1000:.0f} ms ({fresh[1]}건 반영) | "
+            f"채워진 DB: {populated[0] * 1000:.0f} ms "
+            f"({populated[1]}건 반영, {populated[2]}건 건너뜀)"
+        )
+
+
+if __name__ == "__main__":
+    main()
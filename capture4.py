@@ -20,6 +20,8 @@ except ImportError:
     GOOGLE_LIB_AVAILABLE = False
     print("필수 라이브러리가 없습니다. (pip install google-api-python-client google-auth-oauthlib requests)")
 
+from google_api_executor import api_executor  # 재시도/속도 제한 (viewer12.py와 공용)
+
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLineEdit, QLabel, QFileDialog, QMessageBox, QCheckBox, QFrame,
@@ -141,7 +143,9 @@ class UploadThread(QThread):
 
             # 6. 업로드 실행
             media = MediaIoBaseUpload(image_data, mimetype='image/jpeg', resumable=True)
-            file = service.files().create(body=file_metadata, media_body=media, fields='id').execute()
+            request = service.files().create(body=file_metadata, media_body=media, fields='id')
+            # 파일 생성은 다시 보내면 중복 파일이 생기므로 서버가 거절한 경우(429)만 재시도
+            file = api_executor("drive").execute(request, idempotent=False)
 
             self.finished_signal.emit(True, f"업로드 성공: {self.file_name}")
 
@@ -0,0 +1,211 @@
+"""Google API 요청 실행기 (viewer12.py, capture4.py 공용).
+
+- 429/5xx, 속도 제한 403, 네트워크 오류는 지수 백오프 + 지터로 재시도
+  (파일 생성/행 추가처럼 두 번 실행되면 안 되는 요청은 거절이 확실한 429/속도 제한만)
+- API(Drive/Sheets)별 토큰 버킷으로 요청 속도를 할당량 아래로 유지
+- 요청 수/재시도/지연 시간 지표 (동기화 진행 창에 표시)
+
+googleapiclient를 직접 import하지 않으므로 라이브러리가 없어도 불러올 수 있습니다.
+"""
+
+import random
+import threading
+import time
+
+RETRYABLE_HTTP_STATUS = {429, 500, 502, 503, 504}
+# Drive는 속도 제한을 403으로 돌려주기도 함
+RATE_LIMIT_REASONS = (b"rateLimitExceeded", b"userRateLimitExceeded")
+
+# API별 (초당 요청 수, 최대 몰아쓰기) - 사용자당 기본 할당량보다 낮게
+API_LIMITS = {
+    "drive": (10.0, 20),
+    "sheets": (1.0, 60),  # 분당 60회
+}
+API_LABELS = {"drive": "Drive", "sheets": "Sheets"}
+
+
+def http_status(error):
+    """HttpError의 상태 코드 (없으면 None)."""
+    status = getattr(getattr(error, "resp", None), "status", None)
+    try:
+        return int(status)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limited(error):
+    """서버가 요청을 처리하지 않고 거절한 경우 (429, 속도 제한 403)."""
+    status = http_status(error)
+    if status == 429:
+        return True
+    if status == 403:
+        content = getattr(error, "content", b"") or b""
+        if isinstance(content, str):
+            content = content.encode("utf-8", "ignore")
+        return any(reason in content for reason in RATE_LIMIT_REASONS)
+    return False
+
+
+def is_retryable(error, idempotent=True):
+    if is_rate_limited(error):
+        return True
+    if not idempotent:
+        # 5xx/시간 초과는 서버에서 이미 처리됐을 수 있음 (다시 보내면 중복 생성)
+        return False
+    return http_status(error) in RETRYABLE_HTTP_STATUS or isinstance(
+        error, (TimeoutError, ConnectionError)
+    )
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷. acquire()는 토큰이 생길 때까지 기다립니다."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 예약하고, 기다린 시간(초)을 돌려줍니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RequestMetrics:
+    """요청 수, 재시도, 실패, 대기/지연 시간 누계.
+
+    최대 지연 시간(window_latency_max)은 누계에서 뺄 수 없으므로
+    start_window() 이후 구간의 값을 따로 둡니다.
+    """
+
+    FIELDS = ("requests", "retries", "failures", "throttled", "latency", "window_latency_max")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = dict.fromkeys(self.FIELDS, 0)
+
+    def record(self, latency, waited=0.0, retried=False, failed=False):
+        with self._lock:
+            values = self._values
+            values["requests"] += 1
+            values["retries"] += int(retried)
+            values["failures"] += int(failed)
+            values["throttled"] += waited
+            values["latency"] += latency
+            values["window_latency_max"] = max(values["window_latency_max"], latency)
+
+    def start_window(self):
+        with self._lock:
+            self._values["window_latency_max"] = 0
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+
+class ApiExecutor:
+    """한 API의 요청을 속도 제한과 재시도를 적용해 실행합니다."""
+
+    def __init__(self, name, rate, burst, retries=5, base_delay=1.0, max_delay=32.0):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.metrics = RequestMetrics()
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def call(self, fn, log=None, idempotent=True):
+        """fn()을 실행합니다. (요청 객체의 execute, 다운로더의 next_chunk 등)
+
+        idempotent=False면 서버가 거절한 경우(429/속도 제한)에만 다시 보냅니다.
+        """
+        for attempt in range(self.retries + 1):
+            waited = self.bucket.acquire()
+            start = time.perf_counter()
+            try:
+                result = fn()
+            except Exception as e:
+                latency = time.perf_counter() - start
+                if not is_retryable(e, idempotent) or attempt == self.retries:
+                    self.metrics.record(latency, waited, failed=True)
+                    raise
+                self.metrics.record(latency, waited, retried=True)
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+                delay += random.uniform(0, self.base_delay)
+                if log is not None:
+                    reason = http_status(e) or type(e).__name__
+                    log(f"{API_LABELS.get(self.name, self.name)} 요청 실패({reason}), {delay:.1f}초 후 재시도...")
+                time.sleep(delay)
+                continue
+            self.metrics.record(time.perf_counter() - start, waited)
+            return result
+
+    def execute(self, request, log=None, idempotent=True):
+        return self.call(request.execute, log=log, idempotent=idempotent)
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def api_executor(name):
+    """API 이름("drive"/"sheets")별로 프로세스 전체가 함께 쓰는 실행기."""
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            rate, burst = API_LIMITS[name]
+            executor = _executors[name] = ApiExecutor(name, rate, burst)
+        return executor
+
+
+def metrics_snapshot():
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.metrics.snapshot() for executor in executors}
+
+
+def start_metrics_window():
+    """새 집계 구간을 시작하고 기준 스냅샷을 돌려줍니다. (format_metrics의 baseline)"""
+    with _executors_lock:
+        executors = list(_executors.values())
+    for executor in executors:
+        executor.metrics.start_window()
+    return metrics_snapshot()
+
+
+def format_metrics(current, baseline=None):
+    """metrics_snapshot() 두 개의 차이를 한 줄 요약으로 만듭니다.
+
+    baseline은 start_metrics_window()로 받은 것이어야 최대 지연 시간이 같은 구간 값이 됩니다.
+    """
+    baseline = baseline or {}
+    parts = []
+    for name in sorted(current):
+        now = current[name]
+        before = baseline.get(name, {})
+        count = now["requests"] - before.get("requests", 0)
+        if count <= 0:
+            continue
+        retries = now["retries"] - before.get("retries", 0)
+        failures = now["failures"] - before.get("failures", 0)
+        throttled = now["throttled"] - before.get("throttled", 0)
+        avg_ms = (now["latency"] - before.get("latency", 0)) / count * 1000
+        text = f"{API_LABELS.get(name, name)} 요청 {count} · 재시도 {retries}"
+        if failures:
+            text += f" · 실패 {failures}"
+        text += f" · 평균 {avg_ms:.0f}ms (최대 {now['window_latency_max'] * 1000:.0f}ms)"
+        if throttled >= 0.1:
+            text += f" · 속도 제한 대기 {throttled:.1f}s"
+        parts.append(text)
+    return " | ".join(parts)
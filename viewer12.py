@@ -1,8 +1,18 @@
+import time
+
+STARTUP_T0 = time.perf_counter()  # 시작 시간 보고의 기준점 (다른 import보다 먼저)
+
 import sys
 import json
 import os
+import importlib.util
 import re
 import csv
+import hashlib
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, namedtuple
 from datetime import datetime
 import sqlite3
 import webbrowser
@@ -67,13 +77,14 @@ from PySide6.QtGui import (
     QPainter,
     QBrush,
     QPen,
+    QImage,
+    QImageReader,
 )
 from PySide6.QtCore import (
     Qt,
     QPoint,
     QDir,
     QModelIndex,
-    QRegularExpression,
     QSortFilterProxyModel,
     Signal,
     QEvent,
@@ -82,34 +93,978 @@ from PySide6.QtCore import (
     QEasingCurve,
     Property,
     QRect,
+    QSize,
     QThread,
+    QObject,
+    QRunnable,
+    QThreadPool,
+)
+
+from google_api_executor import (
+    api_executor,
+    format_metrics,
+    metrics_snapshot,
+    start_metrics_window,
 )
 
 # --- 구글 드라이브 연동 라이브러리 ---
-try:
-    from google.oauth2 import service_account
-    from googleapiclient.discovery import build
-    from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
-
-    GOOGLE_LIB_AVAILABLE = True
-except ImportError:
-    GOOGLE_LIB_AVAILABLE = False
+# 실제 import는 느리므로 동기화를 시작할 때(google_api) 수행하고, 시작 시에는 설치 여부만 확인
+def _module_installed(name):
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+GOOGLE_LIB_AVAILABLE = _module_installed("googleapiclient") and _module_installed(
+    "google.oauth2"
+)
+if not GOOGLE_LIB_AVAILABLE:
     print("Google API 라이브러리가 설치되지 않았습니다.")
 
+_google_api = None
+
+
+def google_api():
+    """Google 클라이언트 모듈을 처음 필요할 때 import하여 돌려줍니다."""
+    global _google_api
+    if _google_api is None:
+        from types import SimpleNamespace
+        import httplib2
+        from google.oauth2 import service_account
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build, build_from_document
+        from googleapiclient.discovery_cache import get_static_doc
+        from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
+
+        _google_api = SimpleNamespace(
+            service_account=service_account,
+            build=build,
+            build_from_document=build_from_document,
+            get_static_doc=get_static_doc,
+            AuthorizedHttp=AuthorizedHttp,
+            httplib2=httplib2,
+            MediaIoBaseDownload=MediaIoBaseDownload,
+            MediaFileUpload=MediaFileUpload,
+        )
+    return _google_api
+
+
+# --- [Google 클라이언트 재사용] ---
+class GoogleClientFactory:
+    """서비스 계정 인증 정보와 Google API 서비스 객체를 프로세스가 끝날 때까지 재사용합니다.
+
+    - 인증 정보는 (키 파일, 범위)별로 한 번만 읽습니다. (액세스 토큰도 만료 전까지 재사용)
+    - discovery 문서는 라이브러리에 포함된 정적 문서를 씁니다. (네트워크 요청 없음)
+    - 서비스 객체(httplib2)는 스레드 안전하지 않으므로 acquire로 빌리고 release로 반납합니다.
+      반납된 객체는 keep-alive 연결을 유지한 채 다음 동기화에서 다시 쓰입니다.
+    """
+
+    HTTP_TIMEOUT = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials = {}
+        self._documents = {}
+        self._idle = {}
+        self._leased = {}
+
+    def _credentials_key(self, key_file, scopes):
+        # 키 파일을 바꾸면 수정 시각이 달라져 새로 읽음
+        path = os.path.abspath(key_file)
+        return (path, os.path.getmtime(path), tuple(sorted(scopes)))
+
+    def credentials(self, key_file, scopes):
+        key = self._credentials_key(key_file, scopes)
+        with self._lock:
+            creds = self._credentials.get(key)
+        if creds is None:
+            creds = google_api().service_account.Credentials.from_service_account_file(
+                key_file, scopes=list(scopes)
+            )
+            with self._lock:
+                creds = self._credentials.setdefault(key, creds)
+        return creds
+
+    def _document(self, api, version):
+        with self._lock:
+            if (api, version) in self._documents:
+                return self._documents[(api, version)]
+        document = google_api().get_static_doc(api, version)
+        with self._lock:
+            self._documents[(api, version)] = document
+        return document
+
+    def acquire(self, api, version, key_file, scopes):
+        """(api, version, 키 파일, 범위)에 맞는 서비스 객체를 빌립니다."""
+        pool_key = (api, version) + self._credentials_key(key_file, scopes)
+        with self._lock:
+            idle = self._idle.get(pool_key)
+            if idle:
+                service = idle.pop()
+                self._leased[id(service)] = pool_key
+                return service
+
+        google = google_api()
+        http = google.AuthorizedHttp(
+            self.credentials(key_file, scopes),
+            http=google.httplib2.Http(timeout=self.HTTP_TIMEOUT),
+        )
+        document = self._document(api, version)
+        if document is not None:
+            service = google.build_from_document(document, http=http)
+        else:
+            # 정적 문서가 없는 API/버전이면 온라인 discovery
+            service = google.build(api, version, http=http, cache_discovery=False)
+        with self._lock:
+            self._leased[id(service)] = pool_key
+        return service
+
+    def release(self, service):
+        """빌린 서비스 객체를 반납합니다."""
+        with self._lock:
+            pool_key = self._leased.pop(id(service), None)
+            if pool_key is not None:
+                self._idle.setdefault(pool_key, []).append(service)
+
+
+google_clients = GoogleClientFactory()
+
+
+# --- [시작 시간 측정] ---
+class StartupProfiler:
+    """프로세스 시작부터 첫 화면 표시까지 단계별 소요 시간을 기록합니다."""
+
+    def __init__(self, start=STARTUP_T0):
+        self.start = start
+        self.last = start
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        total = self.last - self.start
+        print(f"[시작 시간] 첫 화면까지 {total * 1000:.0f} ms")
+        for phase, seconds in self.phases:
+            print(f"  - {phase}: {seconds * 1000:.0f} ms")
+
+
+# --- [가사 전문 검색 색인] ---
+LYRICS_FTS_TABLE = "song_lyrics_fts"
+LYRICS_FTS_MIN_TERM = 3  # trigram 토크나이저는 3글자 이상 검색어만 색인 조회 가능
+
+
+LYRICS_FTS_TRIGGERS = ("song_metadata_fts_ai", "song_metadata_fts_ad", "song_metadata_fts_au")
+
+
+def ensure_lyrics_fts(con):
+    """song_metadata와 트리거로 동기화되는 FTS5(trigram) 가사 색인을 준비합니다.
+
+    색인 행의 rowid를 song_metadata의 rowid와 같게 두어 트리거가 색인 조회로
+    행을 찾습니다. (song_metadata는 VACUUM하지 않으므로 rowid가 유지됨)
+    색인이 처음 만들어지면 기존 가사를 한 번에 채워 넣습니다.
+    SQLite에 FTS5/trigram이 없으면 False를 돌려주며, 이때는 LIKE 검색을 사용합니다.
+    """
+    cur = con.cursor()
+    try:
+        exists = has_table(con, LYRICS_FTS_TABLE)
+        if not exists:
+            cur.execute(
+                f"""
+                CREATE VIRTUAL TABLE {LYRICS_FTS_TABLE} USING fts5(
+                    file_path UNINDEXED, lyrics, tokenize='trigram'
+                )
+                """
+            )
+        # INSERT OR REPLACE로 지워진 행의 rowid가 재사용될 수 있어 삽입 전에 비움
+        cur.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS song_metadata_fts_ai
+            AFTER INSERT ON song_metadata BEGIN
+                DELETE FROM {LYRICS_FTS_TABLE} WHERE rowid = new.rowid;
+                INSERT INTO {LYRICS_FTS_TABLE} (rowid, file_path, lyrics)
+                VALUES (new.rowid, new.file_path, new.lyrics);
+            END
+            """
+        )
+        cur.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS song_metadata_fts_ad
+            AFTER DELETE ON song_metadata BEGIN
+                DELETE FROM {LYRICS_FTS_TABLE} WHERE rowid = old.rowid;
+            END
+            """
+        )
+        cur.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS song_metadata_fts_au
+            AFTER UPDATE OF file_path, lyrics ON song_metadata BEGIN
+                DELETE FROM {LYRICS_FTS_TABLE} WHERE rowid = old.rowid;
+                INSERT INTO {LYRICS_FTS_TABLE} (rowid, file_path, lyrics)
+                VALUES (new.rowid, new.file_path, new.lyrics);
+            END
+            """
+        )
+        if not exists:
+            cur.execute(
+                f"""
+                INSERT INTO {LYRICS_FTS_TABLE} (rowid, file_path, lyrics)
+                SELECT rowid, file_path, lyrics FROM song_metadata
+                """
+            )
+            print(f"가사 검색 색인 생성: {cur.rowcount}곡")
+        con.commit()
+        return True
+    except sqlite3.OperationalError as e:
+        con.rollback()
+        print(f"가사 전문 검색 색인을 사용할 수 없습니다 (LIKE 검색 사용): {e}")
+        return False
+
+
+def rebuild_lyrics_fts(con):
+    """가사 색인과 트리거를 지우고 현재 방식(rowid 연결)으로 다시 만듭니다."""
+    for trigger in LYRICS_FTS_TRIGGERS:
+        con.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    con.execute(f"DROP TABLE IF EXISTS {LYRICS_FTS_TABLE}")
+    return ensure_lyrics_fts(con)
+
+
+def fts_phrase(keyword):
+    """검색어를 FTS5 구문 문자열로 감쌉니다. (따옴표 이스케이프)"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+# --- [DB 스키마 마이그레이션] ---
+def apply_schema_migrations(con, migrations):
+    """아직 적용되지 않은 마이그레이션을 버전 순서대로 한 번씩 실행합니다.
+
+    migrations: [(버전, 이름, 함수(con))] - 함수가 False를 돌려주면 (예: FTS5 미지원)
+    기록하지 않고 다음 실행 때 다시 시도합니다. 적용 내역은 schema_migrations 테이블에,
+    빠짐없이 적용된 마지막 버전은 PRAGMA user_version에 남겨 이후 시작 시에는 바로 건너뜁니다.
+    """
+    latest = max(version for version, _name, _func in migrations)
+    current = con.execute("PRAGMA user_version").fetchone()[0]
+    if current >= latest:
+        return current
+
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT,
+            applied_at TEXT
+        )
+        """
+    )
+    con.commit()
+    applied = {row[0] for row in con.execute("SELECT version FROM schema_migrations")}
+    for version, name, func in sorted(migrations, key=lambda m: m[0]):
+        if version in applied:
+            continue
+        try:
+            if func(con) is False:
+                con.rollback()
+                continue
+            con.execute(
+                "INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+                (version, name, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            )
+            con.commit()
+            applied.add(version)
+            print(f"DB 마이그레이션 {version} 적용: {name}")
+        except Exception as e:
+            con.rollback()
+            print(f"DB 마이그레이션 {version} ({name}) 실패: {e}")
+            break
+
+    for version, _name, _func in sorted(migrations, key=lambda m: m[0]):
+        if version not in applied:
+            break
+        current = version
+    con.execute(f"PRAGMA user_version = {int(current)}")
+    con.commit()
+    return current
+
+
+# path_key: 대소문자/구분자 차이를 없앤 상대경로 (고유 색인으로 조회)
+# SQLite lower()는 ASCII만 소문자로 바꾸므로 Python 쪽도 같은 규칙을 씀
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+PATH_KEY_SQL = "lower(replace({column}, '\\', '/'))"
+
+
+def metadata_path_key(rel_path):
+    return rel_path.replace("\\", "/").translate(_ASCII_LOWER)
+
+
+def migrate_path_key(con):
+    """song_metadata에 path_key 열과 고유 색인을 추가하고 기존 행을 채웁니다.
+
+    대소문자/구분자만 다른 중복 행은 updated_at이 가장 최근인 행만 남깁니다.
+    """
+    cols = {row[1] for row in con.execute("PRAGMA table_info(song_metadata)")}
+    if "path_key" not in cols:
+        con.execute("ALTER TABLE song_metadata ADD COLUMN path_key TEXT")
+    rows = con.execute(
+        "SELECT rowid, file_path FROM song_metadata"
+        " ORDER BY COALESCE(updated_at, '') DESC, rowid DESC"
+    ).fetchall()
+    seen = set()
+    for rowid, file_path in rows:
+        key = metadata_path_key(file_path or "")
+        if key in seen:
+            con.execute("DELETE FROM song_metadata WHERE rowid = ?", (rowid,))
+            continue
+        seen.add(key)
+        con.execute(
+            "UPDATE song_metadata SET path_key = ? WHERE rowid = ?", (key, rowid)
+        )
+    con.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_song_metadata_path_key"
+        " ON song_metadata(path_key)"
+    )
+    # path_key를 모르는 쓰기(이전 버전/외부 도구)와 경로 변경에도 열이 채워지도록
+    con.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS song_metadata_path_key_ai
+        AFTER INSERT ON song_metadata WHEN new.path_key IS NULL BEGIN
+            UPDATE song_metadata SET path_key = {PATH_KEY_SQL.format(column="new.file_path")}
+            WHERE rowid = new.rowid;
+        END
+        """
+    )
+    con.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS song_metadata_path_key_au
+        AFTER UPDATE OF file_path ON song_metadata BEGIN
+            UPDATE song_metadata SET path_key = {PATH_KEY_SQL.format(column="new.file_path")}
+            WHERE rowid = new.rowid;
+        END
+        """
+    )
+
+
+# --- [메타데이터 CSV 가져오기] ---
+METADATA_UPSERT_FROM_CSV_SQL = """
+    INSERT INTO song_metadata (file_path, path_key, song_key, lyrics, updated_at, updated_by, dirty)
+    VALUES (?, ?, ?, ?, ?, ?, 0)
+    ON CONFLICT(path_key) DO UPDATE SET
+        file_path=excluded.file_path,
+        song_key=excluded.song_key,
+        lyrics=excluded.lyrics,
+        updated_at=excluded.updated_at,
+        updated_by=excluded.updated_by,
+        dirty=0
+"""
+
+
+MetadataImportResult = namedtuple(
+    "MetadataImportResult", ["applied", "skipped", "conflicts"]
+)
+
+# 병합 방식: incremental(로컬 미업로드 수정은 conflict_policy로 보호) / full(항상 CSV 기준으로 덮어씀)
+METADATA_SYNC_MODES = ("incremental", "full")
+# 로컬 미업로드(dirty=1) 행과 충돌 시: lww(나중 수정 우선) / keep_both(로컬 유지 + 원격본 보관)
+METADATA_CONFLICT_POLICIES = ("lww", "keep_both")
+
+
+def migrate_metadata_conflicts(con):
+    """충돌 보관(song_metadata_conflicts) 테이블."""
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS song_metadata_conflicts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path_key TEXT,
+            file_path TEXT,
+            song_key TEXT,
+            lyrics TEXT,
+            updated_at TEXT,
+            updated_by TEXT,
+            detected_at TEXT
+        )
+        """
+    )
+
+
+def migrate_metadata_conflicts_unique(con):
+    """같은 중앙 버전(path_key, updated_at)은 한 번만 보관하도록 중복을 지우고 고유 색인을 만듭니다."""
+    con.execute(
+        "DELETE FROM song_metadata_conflicts WHERE id NOT IN"
+        " (SELECT MIN(id) FROM song_metadata_conflicts GROUP BY path_key, updated_at)"
+    )
+    con.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_song_metadata_conflicts_version"
+        " ON song_metadata_conflicts(path_key, updated_at)"
+    )
+
+
+def clear_metadata_conflicts(con, path_keys):
+    """올라갔거나 중앙 버전으로 덮어쓴 행의 보관된 충돌을 지웁니다."""
+    con.executemany(
+        "DELETE FROM song_metadata_conflicts WHERE path_key = ?",
+        [(path_key,) for path_key in path_keys],
+    )
+
+
+def migrate_sheet_row_index(con):
+    """중앙 스프레드시트 행 번호 캐시 (path_key -> 행 번호, 업로드 때 A열 검증 후 사용)."""
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sheet_row_index (
+            spreadsheet_id TEXT NOT NULL,
+            path_key TEXT NOT NULL,
+            row_no INTEGER NOT NULL,
+            PRIMARY KEY (spreadsheet_id, path_key)
+        )
+        """
+    )
+
+
+def metadata_row_hash(file_path, song_key, lyrics, updated_at, updated_by):
+    """한 행의 내용 해시 (가져오기 시 바뀌지 않은 행을 건너뛰는 데 사용)."""
+    h = hashlib.sha1()
+    for value in (file_path, song_key, lyrics, updated_at, updated_by):
+        h.update((value or "").encode("utf-8"))
+        h.update(b"\x1f")
+    return h.digest()
+
+
+def csv_rel_path(raw_path, sheet_music_path):
+    """CSV의 file_path를 악보 폴더 기준 상대경로로 정규화합니다."""
+    rel_path = raw_path.replace("/", os.sep)
+    if os.path.isabs(rel_path):
+        try:
+            base = os.path.normpath(sheet_music_path)
+            p = os.path.normpath(rel_path)
+            if p.lower().startswith(base.lower()):
+                rel_path = os.path.relpath(p, base)
+            else:
+                rel_path = p
+        except Exception:
+            pass
+    return rel_path
+
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_metadata_csv(
+    con,
+    csv_path,
+    sheet_music_path,
+    log=None,
+    chunk_size=500,
+    conflict_policy="lww",
+    incremental=True,
+):
+    """메타데이터 CSV를 조각 단위로 읽어 song_metadata에 반영합니다.
+
+    조각마다 기존 행을 path_key 색인으로 한 번에 읽어 내용 해시를 비교하고,
+    바뀐 행만 executemany로 씁니다. 전체가 한 트랜잭션입니다.
+    CSV의 updated_at이 비어 있으면 기존 값을 유지합니다 (없으면 지금 시각).
+
+    incremental이면 로컬에서 고친 뒤 아직 올리지 않은(dirty) 행은 conflict_policy로
+    처리합니다. incremental이 아니면 예전처럼 dirty 여부와 관계없이 CSV 기준으로 덮어씁니다.
+    updated_at은 편집 시각이라 업로드 순서와 맞지 않으므로, 건너뛰기는 내용 해시로만 판단합니다.
+    """
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    applied = skipped = conflicts = 0
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        # 필수 컬럼 체크(느슨하게 허용)
+        fieldnames = {c.strip() for c in (reader.fieldnames or [])}
+        if "file_path" not in fieldnames:
+            raise ValueError("CSV에 'file_path' 컬럼이 없습니다.")
+
+        with con:
+            for chunk in _chunked(reader, chunk_size):
+                records = {}
+                for row in chunk:
+                    raw_path = (row.get("file_path") or "").strip()
+                    if not raw_path:
+                        continue
+                    rel_path = csv_rel_path(raw_path, sheet_music_path)
+                    records[metadata_path_key(rel_path)] = (
+                        rel_path,
+                        (row.get("song_key") or "").strip(),
+                        (row.get("lyrics") or "").strip(),
+                        (row.get("updated_at") or "").strip(),
+                        (row.get("updated_by") or "").strip(),
+                    )
+                if not records:
+                    continue
+
+                keys = list(records)
+                existing = {
+                    row[0]: row[1:]
+                    for row in con.execute(
+                        "SELECT path_key, file_path, song_key, lyrics, updated_at,"
+                        " updated_by, COALESCE(dirty, 0) FROM song_metadata"
+                        f" WHERE path_key IN ({','.join('?' * len(keys))})",
+                        keys,
+                    )
+                }
+                changed = []
+                kept_remote = []
+                for path_key, (rel_path, song_key, lyrics, updated_at, updated_by) in records.items():
+                    old = existing.get(path_key)
+                    if not updated_at:
+                        updated_at = (old[3] if old else "") or now
+                    record = (rel_path, song_key, lyrics, updated_at, updated_by)
+                    if old is not None and metadata_row_hash(*old[:5]) == metadata_row_hash(*record):
+                        if old[5] and incremental:
+                            # 로컬 수정이 중앙 내용과 같아졌으면 올릴 필요 없음
+                            changed.append((rel_path, path_key) + record[1:])
+                        else:
+                            skipped += 1
+                        continue
+                    if incremental and old is not None and old[5]:
+                        local_updated_at = old[3] or ""
+                        if conflict_policy == "keep_both":
+                            kept_remote.append((path_key,) + record + (now,))
+                            conflicts += 1
+                            continue
+                        if local_updated_at >= updated_at:
+                            # lww: 로컬 수정이 더 최근이면 유지 (다음 업로드 때 올라감)
+                            conflicts += 1
+                            continue
+                    changed.append((rel_path, path_key) + record[1:])
+                if changed:
+                    con.executemany(METADATA_UPSERT_FROM_CSV_SQL, changed)
+                    clear_metadata_conflicts(con, [row[1] for row in changed])
+                if kept_remote:
+                    # 로컬 행이 올라가기 전까지 매번 같은 중앙 버전이 오므로 한 번만 보관
+                    con.executemany(
+                        "INSERT OR IGNORE INTO song_metadata_conflicts (path_key, file_path, song_key,"
+                        " lyrics, updated_at, updated_by, detected_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        kept_remote,
+                    )
+                applied += len(changed)
+                if log is not None:
+                    log(f"가져오는 중: {applied + skipped + conflicts}행 확인 (변경 {applied}건)")
+    return MetadataImportResult(applied, skipped, conflicts)
+
+
+def has_table(con, name):
+    return (
+        con.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ? AND type = 'table'", (name,)
+        ).fetchone()
+        is not None
+    )
+
+
+# --- [메타데이터 저장소] ---
+def open_metadata_connection(db_path, **kwargs):
+    """WAL 모드와 공통 PRAGMA가 적용된 SQLite 연결을 엽니다.
+
+    GUI 스레드는 MetadataRepository의 연결을 재사용하고,
+    동기화 스레드는 이 함수로 자기 스레드 전용 연결을 엽니다.
+    """
+    con = sqlite3.connect(db_path, timeout=10, cached_statements=128, **kwargs)
+    con.execute("PRAGMA journal_mode=WAL")  # 읽기와 쓰기가 서로 막지 않음
+    con.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync 불필요
+    con.execute("PRAGMA cache_size=-8000")  # 약 8MB 페이지 캐시
+    con.execute("PRAGMA temp_store=MEMORY")
+    return con
+
+
+class MetadataRepository:
+    """GUI 스레드 전용 song_metadata 접근 객체 (연결 1개를 계속 유지).
+
+    sqlite3 모듈의 문장 캐시(cached_statements)가 같은 SQL 문자열을 재사용하므로
+    반복되는 조회/저장은 준비된 문장으로 실행됩니다.
+    """
+
+    UPSERT_SQL = """
+        INSERT INTO song_metadata (file_path, path_key, song_key, lyrics, updated_at, updated_by, dirty)
+        VALUES (?, ?, ?, ?, ?, ?, 1)
+        ON CONFLICT(path_key) DO UPDATE SET
+            file_path=excluded.file_path,
+            song_key=excluded.song_key,
+            lyrics=excluded.lyrics,
+            updated_at=excluded.updated_at,
+            updated_by=excluded.updated_by,
+            dirty=1
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._con = None
+
+    @property
+    def con(self):
+        if self._con is None:
+            self._con = open_metadata_connection(self.db_path)
+        return self._con
+
+    def close(self):
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def get(self, rel_path):
+        return self.con.execute(
+            "SELECT song_key, lyrics FROM song_metadata WHERE path_key = ?",
+            (metadata_path_key(rel_path),),
+        ).fetchone()
+
+    def upsert(self, rel_path, song_key, lyrics, editor):
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.con:
+            self.con.execute(
+                self.UPSERT_SQL,
+                (rel_path, metadata_path_key(rel_path), song_key, lyrics, now, editor),
+            )
+
+    def move(self, old_rel_path, new_rel_path, editor):
+        """행을 새 경로로 옮깁니다 (대소문자만 바뀌어 path_key가 같은 경우 포함)."""
+        old_key = metadata_path_key(old_rel_path)
+        new_key = metadata_path_key(new_rel_path)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.con:
+            if new_key != old_key:
+                # 새 경로에 남아 있던 기록은 옮겨 오는 행으로 대체
+                self.con.execute(
+                    "DELETE FROM song_metadata WHERE path_key = ?", (new_key,)
+                )
+            self.con.execute(
+                "UPDATE song_metadata SET file_path=?, path_key=?, updated_at=?,"
+                " updated_by=?, dirty=1 WHERE path_key = ?",
+                (new_rel_path, new_key, now, editor, old_key),
+            )
+
+    def delete(self, rel_path):
+        with self.con:
+            self.con.execute(
+                "DELETE FROM song_metadata WHERE path_key = ?",
+                (metadata_path_key(rel_path),),
+            )
+
+    def load_conflicts(self):
+        """경로별로 가장 최근에 보관된 중앙 버전
+        (path_key, file_path, song_key, lyrics, updated_at, updated_by) 목록."""
+        return self.con.execute(
+            "SELECT path_key, file_path, song_key, lyrics, updated_at, updated_by"
+            " FROM song_metadata_conflicts c WHERE updated_at = ("
+            "   SELECT MAX(updated_at) FROM song_metadata_conflicts"
+            "   WHERE path_key = c.path_key)"
+            " ORDER BY file_path"
+        ).fetchall()
+
+    def accept_conflicts(self, conflicts):
+        """보관된 중앙 버전으로 로컬 행을 덮어쓰고(dirty=0) 충돌 기록을 지웁니다."""
+        with self.con:
+            self.con.executemany(
+                METADATA_UPSERT_FROM_CSV_SQL,
+                [(row[1], row[0]) + tuple(row[2:]) for row in conflicts],
+            )
+            clear_metadata_conflicts(self.con, [row[0] for row in conflicts])
+
+    def load_keys(self):
+        """키가 지정된 곡의 (file_path, song_key) 목록. 가사 본문은 읽지 않습니다."""
+        return self.con.execute(
+            "SELECT file_path, song_key FROM song_metadata"
+            " WHERE song_key IS NOT NULL AND song_key != ''"
+        ).fetchall()
+
+    def search_lyrics(self, keywords, use_fts):
+        """모든 검색어를 가사에 포함하는 file_path(상대경로) 목록을 돌려줍니다.
+
+        색인 검색이면 관련도(rank) 순서입니다.
+        """
+        long_terms = [k for k in keywords if len(k) >= LYRICS_FTS_MIN_TERM]
+        if use_fts and long_terms:
+            # 3글자 이상은 색인(MATCH)으로 좁히고, 짧은 검색어는 그 결과에서 직접 확인
+            # (trigram 테이블의 LIKE는 3글자 미만 패턴에 결과를 주지 않음)
+            short_terms = [k for k in keywords if len(k) < LYRICS_FTS_MIN_TERM]
+            query = f"SELECT file_path FROM {LYRICS_FTS_TABLE} WHERE {LYRICS_FTS_TABLE} MATCH ?"
+            query += "".join([" AND instr(lower(lyrics), ?) > 0"] * len(short_terms))
+            query += " ORDER BY rank"
+            params = [" AND ".join(fts_phrase(k) for k in long_terms)]
+            params += [keyword.lower() for keyword in short_terms]
+        else:
+            query = "SELECT file_path FROM song_metadata WHERE "
+            query += " AND ".join(["lyrics LIKE ?"] * len(keywords))
+            params = [f"%{keyword}%" for keyword in keywords]
+        return [row[0] for row in self.con.execute(query, params)]
+
+
+class MetadataCache(dict):
+    """정규화 경로 -> 키 캐시. 값이 바뀐 경로를 구독자에게 하나씩 알립니다.
+
+    시작 시에는 키가 지정된 곡의 (경로, 키)만 읽어 들이고, 가사 본문은
+    인스펙터 등에서 필요할 때 DB에서 가져와 크기가 제한된 LRU(lyrics)에 보관합니다.
+    """
+
+    LYRICS_ITEMS = 256
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listeners = []
+        self.lyrics = OrderedDict()
+
+    def cached_lyrics(self, path):
+        """LRU에 있으면 가사를, 없으면 None을 돌려줍니다."""
+        lyrics = self.lyrics.get(path)
+        if lyrics is not None:
+            self.lyrics.move_to_end(path)
+        return lyrics
+
+    def put_lyrics(self, path, lyrics):
+        self.lyrics[path] = lyrics or ""
+        self.lyrics.move_to_end(path)
+        while len(self.lyrics) > self.LYRICS_ITEMS:
+            self.lyrics.popitem(last=False)
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def _notify(self, path):
+        for callback in self._listeners:
+            callback(path)
+
+    def __setitem__(self, path, value):
+        changed = path not in self or self[path] != value
+        super().__setitem__(path, value)
+        if changed:
+            self._notify(path)
+
+    def __delitem__(self, path):
+        super().__delitem__(path)
+        self.lyrics.pop(path, None)
+        self._notify(path)
+
+    def pop(self, path, *default):
+        existed = path in self
+        value = super().pop(path, *default)
+        self.lyrics.pop(path, None)
+        if existed:
+            self._notify(path)
+        return value
+
+    def replace_all(self, mapping):
+        """전체 교체 (동기화 직후). 개별 알림 없이 바꾸므로 호출 측에서 전체 갱신합니다."""
+        super().clear()
+        super().update(mapping)
+        self.lyrics.clear()
+
+
+# --- [파일 카탈로그 인덱스] ---
+# base_lower: 확장자를 뺀 소문자 이름, is_listed: 표시 대상 확장자 여부
+CatalogEntry = namedtuple("CatalogEntry", ["base_lower", "is_dir", "is_listed"])
+
+
+def catalog_key(path):
+    """QFileSystemModel 경로와 os.walk 경로를 같은 키로 맞춥니다 (구분자/대소문자)."""
+    return os.path.normcase(path).replace("\\", "/")
+
+
+def name_ngrams(text, n=2):
+    """문자열의 n-gram 집합 (n보다 짧으면 문자열 자체)."""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+class FileCatalog:
+    """폴더 아래 파일 목록을 메모리에 색인하여, 필터 판정을 사전 조회로 처리합니다.
+
+    시작 시 FileCatalogBuildThread가 한 번 전체를 스캔하고, 이후에는
+    QFileSystemModel(파일 감시자)의 행 추가/삭제/이름 변경 시그널로 갱신합니다.
+    색인에 없는 경로는 필터 판정 시점에 모델 값으로 채워 넣습니다.
+
+    표시 대상 파일의 이름은 글자 단위 unigram/bigram 역색인(_grams)에도 올려,
+    다중 키워드 이름 검색을 게시 목록 교집합으로 처리합니다.
+    """
+
+    def __init__(self, extensions):
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.entries = {}  # catalog_key(path) -> CatalogEntry
+        self._grams = {}  # 1글자/2글자 조각 -> {catalog_key}
+        self.generation = 0  # 항목이 바뀔 때마다 증가 (검색 결과 캐시 무효화용)
+
+    @staticmethod
+    def _index_terms(base_lower):
+        return set(base_lower) | name_ngrams(base_lower)
+
+    def _index(self, key, entry):
+        if not entry.is_listed:
+            return
+        for term in self._index_terms(entry.base_lower):
+            self._grams.setdefault(term, set()).add(key)
+
+    def _unindex(self, key, entry):
+        if not entry.is_listed:
+            return
+        for term in self._index_terms(entry.base_lower):
+            keys = self._grams.get(term)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._grams[term]
+
+    def match_names(self, keywords):
+        """모든 키워드를 이름에 포함하는 표시 대상 파일의 키 집합을 돌려줍니다."""
+        keywords = [keyword for keyword in keywords if keyword]
+        if not keywords:
+            return set()
+        terms = set()
+        for keyword in keywords:
+            terms |= name_ngrams(keyword)
+        # 게시 목록이 짧은 조각부터 교집합하여 후보를 빠르게 줄임
+        candidates = None
+        for term in sorted(terms, key=lambda t: len(self._grams.get(t, ()))):
+            keys = self._grams.get(term)
+            if not keys:
+                return set()
+            candidates = set(keys) if candidates is None else candidates & keys
+            if not candidates:
+                return set()
+        # bigram 교집합은 후보일 뿐이므로 실제 부분 문자열인지 확인
+        if any(len(keyword) > 2 for keyword in keywords):
+            candidates = {
+                key for key in candidates
+                if all(keyword in self.entries[key].base_lower for keyword in keywords)
+            }
+        return candidates
+
+    def make_entry(self, path, is_dir):
+        name = os.path.basename(path.rstrip("/\\"))
+        if is_dir:
+            return CatalogEntry(name.lower(), True, False)
+        return CatalogEntry(
+            os.path.splitext(name)[0].lower(),
+            False,
+            name.lower().endswith(self.extensions),
+        )
+
+    def scan(self, root, should_stop=None):
+        """root 아래 전체를 스캔한 {키: 항목} 사전을 돌려줍니다. (워커 스레드에서 호출)"""
+        entries = {}
+        for dir_path, dir_names, file_names in os.walk(root):
+            if should_stop is not None and should_stop():
+                break
+            for name in dir_names:
+                path = os.path.join(dir_path, name)
+                entries[catalog_key(path)] = self.make_entry(path, True)
+            for name in file_names:
+                path = os.path.join(dir_path, name)
+                entries[catalog_key(path)] = self.make_entry(path, False)
+        return entries
+
+    def merge(self, entries):
+        # 스캔 도중 감시자로 먼저 들어온 항목이 더 최신이므로 덮어쓰지 않음
+        for key, entry in entries.items():
+            if key not in self.entries:
+                self.entries[key] = entry
+                self._index(key, entry)
+        self.generation += 1
+
+    def clear(self):
+        self.entries.clear()
+        self._grams.clear()
+        self.generation += 1
+
+    def get(self, path):
+        return self.entries.get(catalog_key(path))
+
+    def add(self, path, is_dir):
+        key = catalog_key(path)
+        old = self.entries.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        entry = self.make_entry(path, is_dir)
+        self.entries[key] = entry
+        self._index(key, entry)
+        self.generation += 1
+        return entry
+
+    def remove(self, path):
+        key = catalog_key(path)
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self._unindex(key, entry)
+        if entry.is_dir:
+            prefix = key.rstrip("/") + "/"
+            for child in [k for k in self.entries if k.startswith(prefix)]:
+                self._unindex(child, self.entries.pop(child))
+        self.generation += 1
+
+    def rename(self, old_path, new_path):
+        entry = self.get(old_path)
+        is_dir = entry.is_dir if entry is not None else os.path.isdir(new_path)
+        # 폴더 이름이 바뀌면 하위 항목은 다시 조회될 때 새 경로로 채워짐
+        self.remove(old_path)
+        self.add(new_path, is_dir)
+
+    def attach(self, model):
+        """QFileSystemModel의 변경 시그널로 색인을 증분 갱신합니다."""
+
+        def on_rows_inserted(parent, first, last):
+            for row in range(first, last + 1):
+                index = model.index(row, 0, parent)
+                self.add(model.filePath(index), model.isDir(index))
+
+        def on_rows_removed(parent, first, last):
+            for row in range(first, last + 1):
+                self.remove(model.filePath(model.index(row, 0, parent)))
+
+        def on_file_renamed(dir_path, old_name, new_name):
+            self.rename(os.path.join(dir_path, old_name), os.path.join(dir_path, new_name))
+
+        model.rowsInserted.connect(on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(on_rows_removed)
+        model.fileRenamed.connect(on_file_renamed)
+
+
+class FileCatalogBuildThread(QThread):
+    built = Signal(dict)
+
+    def __init__(self, catalog, root):
+        super().__init__()
+        self.catalog = catalog
+        self.root = root
+
+    def run(self):
+        try:
+            entries = self.catalog.scan(self.root, self.isInterruptionRequested)
+            if not self.isInterruptionRequested():
+                self.built.emit(entries)
+        except Exception as e:
+            print(f"파일 색인 생성 오류 (무시됨): {e}")
+
 
 # --- [기존 클래스 유지] ---
 class CustomSortFilterProxyModel(QSortFilterProxyModel):
     itemRenamed = Signal(str)
 
-    def __init__(self, extensions, favorites, metadata_cache, parent=None):
+    def __init__(self, extensions, favorites, metadata_cache, parent=None, catalog=None):
         super().__init__(parent)
         self.extensions = extensions
         self.favorites = favorites
         self.metadata_cache = metadata_cache
-        self.lyrics_filter_set = None
+        if isinstance(metadata_cache, MetadataCache):
+            metadata_cache.subscribe(self.on_metadata_changed)
+        self.catalog = catalog if catalog is not None else FileCatalog(extensions)
+        self.lyrics_ranks = None  # 가사 검색 결과 {경로: 관련도 순위(0이 최상)}, 검색 중이 아니면 None
         self.favorites_only_mode = False
         self.key_filter = "전체"
-        self._filter_regex = QRegularExpression("")
+        self._name_keywords = []
+        self._name_matches = None  # 이름 검색 결과 {catalog_key}, 검색어 없으면 None
+        self._name_matches_generation = -1
         self.setRecursiveFilteringEnabled(False)
         self.setSortRole(Qt.DisplayRole)
 
@@ -122,10 +1077,7 @@ class CustomSortFilterProxyModel(QSortFilterProxyModel):
 
         if role == Qt.UserRole:
             file_path = source_model.filePath(source_index)
-            if file_path in self.metadata_cache:
-                song_key = self.metadata_cache[file_path][0]
-                return song_key if song_key else ""
-            return ""
+            return self.metadata_cache.get(file_path) or ""
 
         if role == Qt.DisplayRole:
             # 이름 열(0)만 커스텀 표시, 나머지(크기/유형/날짜)는 소스 모델 값 사용
@@ -149,11 +1101,31 @@ class CustomSortFilterProxyModel(QSortFilterProxyModel):
 
         return super().data(index, role)
 
-    def set_lyrics_filter(self, paths_set):
-        self.lyrics_filter_set = paths_set
-        if paths_set is not None:
-            self.setFilterRegularExpression(QRegularExpression(""))
-        self.invalidateFilter()
+    def set_lyrics_filter(self, ranks):
+        """가사 검색 결과로 거르고, 이름순 정렬일 때는 관련도 순으로 보여 줍니다."""
+        self.lyrics_ranks = ranks
+        if ranks is not None:
+            self._name_keywords = []
+            self._name_matches = None
+            if self.sortColumn() < 0:
+                self.sort(0, Qt.AscendingOrder)
+        self.invalidate()
+
+    def on_metadata_changed(self, path):
+        """한 파일의 키/가사가 바뀌었을 때 그 행만 갱신합니다."""
+        source_model = self.sourceModel()
+        if source_model is None:
+            return
+        source_index = source_model.index(path)
+        if not source_index.isValid():
+            return
+        if self.key_filter != "전체":
+            # 소스 행의 dataChanged를 받으면 프록시가 그 행만 다시 필터링/정렬함
+            source_model.dataChanged.emit(source_index, source_index)
+            return
+        index = self.mapFromSource(source_index)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.UserRole])
 
     def set_key_filter(self, key_text):
         self.key_filter = key_text
@@ -162,55 +1134,77 @@ class CustomSortFilterProxyModel(QSortFilterProxyModel):
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         source_model = self.sourceModel()
         index = source_model.index(source_row, 0, source_parent)
-        is_dir = source_model.isDir(index)
         file_path = source_model.filePath(index)
 
-        if self.lyrics_filter_set is not None:
-            if is_dir:
-                return True
-            else:
-                return file_path in self.lyrics_filter_set
-
-        if self.favorites_only_mode:
-            if is_dir:
-                return True
-            else:
-                return file_path in self.favorites
+        # 이름/확장자/폴더 여부는 카탈로그 사전 조회 (없으면 이번에 채움)
+        key = catalog_key(file_path)
+        entry = self.catalog.entries.get(key)
+        if entry is None:
+            entry = self._add_to_catalog(key, file_path, source_model.isDir(index))
 
-        if is_dir:
+        if entry.is_dir:
             return True
-        else:
-            passes_key_check = False
-            if self.key_filter == "전체":
-                passes_key_check = True
-            else:
-                metadata = self.metadata_cache.get(file_path, ("", ""))
-                song_key = metadata[0]
 
-                if song_key is None:
-                    song_key = ""
+        if self.lyrics_ranks is not None:
+            return file_path in self.lyrics_ranks
 
-                if self.key_filter == "미지정":
-                    passes_key_check = song_key == ""
-                else:
-                    passes_key_check = song_key.upper() == self.key_filter.upper()
+        if self.favorites_only_mode:
+            return file_path in self.favorites
+
+        if self.key_filter != "전체":
+            song_key = self.metadata_cache.get(file_path) or ""
 
-            if not passes_key_check:
+            if self.key_filter == "미지정":
+                if song_key != "":
+                    return False
+            elif song_key.upper() != self.key_filter.upper():
                 return False
 
-            file_name = source_model.fileName(index)
-            base_name, _ = os.path.splitext(file_name)
+        if not entry.is_listed:
+            return False
+        if not self._name_keywords:
+            return True
+        return key in self._current_name_matches()
 
-            if self._filter_regex.pattern() == "":
-                return file_path.lower().endswith(tuple(self.extensions))
+    def _add_to_catalog(self, key, file_path, is_dir):
+        # 필터 도중 채워 넣는 항목은 검색 결과에 바로 반영해 전체 재계산을 피함
+        in_sync = (
+            self._name_matches is not None
+            and self._name_matches_generation == self.catalog.generation
+        )
+        entry = self.catalog.add(file_path, is_dir)
+        if in_sync:
+            if entry.is_listed and all(
+                keyword in entry.base_lower for keyword in self._name_keywords
+            ):
+                self._name_matches.add(key)
+            self._name_matches_generation = self.catalog.generation
+        return entry
 
-            name_matches = self._filter_regex.match(base_name).hasMatch()
-            return name_matches and file_path.lower().endswith(tuple(self.extensions))
+    def _current_name_matches(self):
+        # 카탈로그가 바뀌었으면 (파일 추가/삭제, 스캔 완료) 검색 결과를 다시 계산
+        if (
+            self._name_matches is None
+            or self._name_matches_generation != self.catalog.generation
+        ):
+            self._name_matches = self.catalog.match_names(self._name_keywords)
+            self._name_matches_generation = self.catalog.generation
+        return self._name_matches
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         """날짜 열(3) 정렬 시 파일 수정 시간 기준으로 비교합니다."""
         source_model = self.sourceModel()
 
+        # 가사 검색 중 이름순이면 관련도 순 (정렬 방향과 관계없이 가장 관련 있는 곡이 위로)
+        if self.lyrics_ranks and left.column() == 0 and self.sortRole() == Qt.DisplayRole:
+            # 순위가 없는 항목(폴더)은 맨 앞에 둠
+            rank_left = self.lyrics_ranks.get(source_model.filePath(left), -1)
+            rank_right = self.lyrics_ranks.get(source_model.filePath(right), -1)
+            if rank_left != rank_right:
+                if self.sortOrder() == Qt.DescendingOrder:
+                    return rank_left > rank_right
+                return rank_left < rank_right
+
         # 날짜 컬럼(3)일 때는 파일의 수정 시간을 기준으로 비교
         if left.column() == 3 and right.column() == 3:
             try:
@@ -265,26 +1259,14 @@ class CustomSortFilterProxyModel(QSortFilterProxyModel):
                     if self.parent():
                         self.parent().save_favorites()
 
-                old_norm = os.path.normpath(old_path)
-                new_norm = os.path.normpath(new_path)
-                if old_norm in self.metadata_cache:
-                    key, lyrics = self.metadata_cache.pop(old_norm)
-                    self.metadata_cache[new_norm] = (key, lyrics)
-                    if self.parent():
-                        parent_window = self.parent()
-                        parent_window.set_metadata_in_db(new_path, key, lyrics)
-                        try:
-                            old_rel = parent_window._to_rel_path(old_path)
-                            con = sqlite3.connect(parent_window.db_path)
-                            cur = con.cursor()
-                            cur.execute(
-                                "DELETE FROM song_metadata WHERE file_path = ?",
-                                (old_rel,),
-                            )
-                            con.commit()
-                            con.close()
-                        except Exception as e:
-                            print(f"DB 이전 경로 삭제 오류: {e}")
+                # 키 없이 가사만 있는 곡은 캐시에 없으므로 DB 기준으로 옮김
+                self.metadata_cache.pop(os.path.normpath(old_path), None)
+                parent_window = self.parent()
+                if (
+                    parent_window is not None
+                    and self.metadata_cache is parent_window.metadata_cache
+                ):
+                    parent_window.move_metadata_in_db(old_path, new_path)
 
                 self.itemRenamed.emit(new_path)
                 return True
@@ -303,8 +1285,10 @@ class CustomSortFilterProxyModel(QSortFilterProxyModel):
                 return headers[section]
         return super().headerData(section, orientation, role)
 
-    def setFilterRegularExpression(self, pattern: QRegularExpression):
-        self._filter_regex = pattern
+    def set_name_keywords(self, keywords):
+        """파일 이름(확장자 제외)에 모든 키워드가 포함된 항목만 표시합니다. (대소문자 무시)"""
+        self._name_keywords = [keyword.lower() for keyword in keywords]
+        self._name_matches = None
         self.invalidateFilter()
 
     def set_favorites_only_mode(self, enabled):
@@ -312,6 +1296,135 @@ class CustomSortFilterProxyModel(QSortFilterProxyModel):
         self.invalidateFilter()
 
 
+# --- [썸네일 캐시] ---
+class ThumbnailStore:
+    """툴팁/미리보기용 썸네일을 디스크(app_dir/thumbnails)와 메모리에 보관합니다.
+
+    키는 원본 경로 + 수정 시간 + 파일 크기의 해시이므로, 원본 파일이
+    바뀌면 새 썸네일이 만들어지고 이전 것은 더 이상 참조되지 않습니다.
+    이렇게 남은 파일은 prune()이 오래 쓰지 않은 것부터 지웁니다.
+    """
+
+    WIDTH = 250
+    # 디스크 썸네일 폴더 상한 (넘으면 오래 쓰지 않은 것부터 삭제)
+    MAX_BYTES = 256 * 1024 * 1024
+    MAX_AGE_DAYS = 90
+
+    def __init__(self, cache_dir, memory_items=1024):
+        self.cache_dir = cache_dir
+        self.memory_items = memory_items
+        self._memory = OrderedDict()  # key -> (thumb_path, QSize)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"썸네일 폴더 생성 실패: {e}")
+
+    def _key(self, path):
+        st = os.stat(path)
+        raw = f"{os.path.normcase(os.path.abspath(path))}|{st.st_mtime_ns}|{st.st_size}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def thumbnail_for(self, path):
+        """(썸네일 파일 경로, 크기)를 돌려줍니다. 없으면 만들고, 원본을 읽을 수 없으면 None."""
+        return self._lookup(path, generate=True)
+
+    def cached_thumbnail(self, path):
+        """이미 만들어진 썸네일만 돌려줍니다. 없으면 생성하지 않고 None."""
+        return self._lookup(path, generate=False)
+
+    def _lookup(self, path, generate):
+        try:
+            key = self._key(path)
+        except OSError:
+            return None
+
+        hit = self._memory.get(key)
+        if hit is not None:
+            self._memory.move_to_end(key)
+            return hit
+
+        thumb_path = os.path.join(self.cache_dir, f"{key}.png")
+        size = QImageReader(thumb_path).size() if os.path.isfile(thumb_path) else QSize()
+        if size.isValid():
+            # 수정 시각을 마지막 사용 시각으로 씀 (prune 기준)
+            try:
+                os.utime(thumb_path)
+            except OSError:
+                pass
+        else:
+            if not generate:
+                return None
+            image = self._generate(path, thumb_path)
+            if image is None:
+                return None
+            size = image.size()
+
+        entry = (thumb_path, size)
+        self._memory[key] = entry
+        if len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+        return entry
+
+    def prune(self, max_bytes=None, max_age_days=None):
+        """오래 쓰지 않은 썸네일부터 지워 폴더 크기를 제한합니다. (백그라운드 스레드에서 호출)
+
+        MAX_AGE_DAYS 동안 쓰지 않은 파일은 모두 지우고, 남은 합계가 MAX_BYTES를 넘으면
+        가장 오래된 것부터 지웁니다. 원본이 바뀌거나 삭제되어 참조되지 않는 썸네일도
+        이렇게 정리됩니다. 정리를 시작한 뒤에 만들었거나 쓴 파일은 건드리지 않습니다.
+        지운 파일 수를 돌려줍니다.
+        """
+        max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        max_age_days = self.MAX_AGE_DAYS if max_age_days is None else max_age_days
+        started = time.time()
+        files = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".png") or not entry.is_file():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime, st.st_size, entry.path))
+        except OSError as e:
+            print(f"썸네일 정리 실패: {e}")
+            return 0
+
+        files.sort()
+        total = sum(size for _mtime, size, _path in files)
+        expire_before = started - max_age_days * 86400
+        removed = 0
+        for mtime, size, path in files:
+            if mtime >= started or (mtime >= expire_before and total <= max_bytes):
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            print(f"썸네일 정리: {removed}개 삭제 (남은 용량 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def _generate(self, path, thumb_path):
+        reader = QImageReader(path)
+        src_size = reader.size()
+        if src_size.isValid() and src_size.width() > 0:
+            # JPEG 등은 디코딩 단계에서 바로 축소되어 원본 전체 디코딩을 피함
+            height = max(1, round(src_size.height() * self.WIDTH / src_size.width()))
+            reader.setScaledSize(QSize(self.WIDTH, height))
+        image = reader.read()
+        if image.isNull():
+            return None
+        if image.width() != self.WIDTH:
+            image = image.scaledToWidth(self.WIDTH, Qt.SmoothTransformation)
+        if not image.save(thumb_path, "PNG"):
+            print(f"썸네일 저장 실패: {thumb_path}")
+        return image
+
+
 # --- [구글 드라이브 헬퍼 클래스] ---
 class GoogleDriveSync:
     def __init__(self, service_account_file, local_dir, drive_folder_id, app_dir):
@@ -322,28 +1435,135 @@ class GoogleDriveSync:
         self.app_dir = app_dir
         self.service = None
 
+        self._leased = []
+
     def connect(self):
         if not GOOGLE_LIB_AVAILABLE:
             return False
         try:
-            creds = service_account.Credentials.from_service_account_file(
-                self.service_account_file, scopes=self.SCOPES
-            )
-            self.service = build("drive", "v3", credentials=creds)
+            self.service = self.build_service()
             return True
         except Exception as e:
             print(f"연결 실패: {e}")
             return False
 
+    def build_service(self):
+        """Drive 서비스 객체를 빌립니다. (클라이언트가 스레드 안전하지 않아 작업자마다 하나씩)"""
+        service = google_clients.acquire(
+            "drive", "v3", self.service_account_file, self.SCOPES
+        )
+        self._leased.append(service)
+        return service
+
+    def close(self):
+        """빌린 서비스 객체를 반납합니다. (다음 동기화에서 연결째로 재사용)"""
+        while self._leased:
+            google_clients.release(self._leased.pop())
+        self.service = None
+
+    FILE_FIELDS = "id, name, mimeType, modifiedTime, size, md5Checksum, parents, trashed"
+
+    FOLDER_MIME = "application/vnd.google-apps.folder"
+    LIST_BATCH = 20  # list 요청 하나에 묶어 조회할 폴더 수
+
+    def list_children(self, folder_ids, service=None):
+        """여러 폴더 바로 아래의 (휴지통 제외) 항목 전체를 한 번의 질의로 돌려줍니다."""
+        service = service or self.service
+        items = []
+        page_token = None
+        parents = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+        query = f"({parents}) and trashed=false"
+        while True:
+            results = api_executor("drive").execute(
+                service.files().list(
+                    q=query,
+                    pageSize=1000,
+                    fields=f"nextPageToken, files({self.FILE_FIELDS})",
+                    pageToken=page_token,
+                )
+            )
+            items.extend(results.get("files", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                return items
+
+    def walk_tree(self, root_id, max_workers=4):
+        """root_id 아래 폴더 구조를 너비 우선으로 훑습니다.
+
+        같은 깊이의 폴더를 LIST_BATCH개씩 묶어 한 번에 조회하고, 묶음들은
+        작업자 스레드(스레드마다 서비스 객체 하나)에서 동시에 조회합니다.
+        (폴더 id -> {"parent": 상위 폴더 id, "name": 로컬 이름}, 파일 항목 목록)을
+        돌려줍니다. root_id 자신은 {"parent": None, "name": ""}입니다.
+        """
+        folders = {root_id: {"parent": None, "name": ""}}
+        files = []
+        local = threading.local()
+
+        def list_batch(batch):
+            if not hasattr(local, "service"):
+                local.service = self.build_service()
+            return self.list_children(batch, service=local.service)
+
+        level = [root_id]
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            while level:
+                batches = [
+                    level[i : i + self.LIST_BATCH]
+                    for i in range(0, len(level), self.LIST_BATCH)
+                ]
+                level = []
+                for children in pool.map(list_batch, batches):
+                    for item in children:
+                        if item.get("mimeType") == self.FOLDER_MIME:
+                            folders[item["id"]] = {
+                                "parent": next(
+                                    (p for p in item.get("parents", []) if p in folders),
+                                    None,
+                                ),
+                                "name": safe_local_name(item["name"]),
+                            }
+                            level.append(item["id"])
+                        else:
+                            files.append(item)
+        return folders, files
+
+    def get_start_page_token(self):
+        return api_executor("drive").execute(self.service.changes().getStartPageToken())[
+            "startPageToken"
+        ]
+
+    def list_changes(self, page_token):
+        """page_token 이후의 변경 목록과 다음 시작 토큰을 돌려줍니다.
+
+        변경이 없으면 API 호출 한 번으로 끝납니다.
+        """
+        changes = []
+        while True:
+            results = api_executor("drive").execute(
+                self.service.changes().list(
+                    pageToken=page_token,
+                    pageSize=1000,
+                    spaces="drive",
+                    fields=(
+                        "nextPageToken, newStartPageToken, "
+                        f"changes(fileId, removed, file({self.FILE_FIELDS}))"
+                    ),
+                )
+            )
+            changes.extend(results.get("changes", []))
+            if "newStartPageToken" in results:
+                return changes, results["newStartPageToken"]
+            page_token = results["nextPageToken"]
+
     def find_file_in_folder_by_name(self, file_name: str):
         """지정한 Drive 폴더( drive_folder_id ) 안에서 파일명을 기준으로 파일 1개를 찾습니다."""
         if not self.service:
             return None
         query = f"'{self.drive_folder_id}' in parents and trashed=false and name='{file_name}'"
-        results = (
-            self.service.files()
-            .list(q=query, pageSize=5, fields="files(id, name, mimeType, modifiedTime)")
-            .execute()
+        results = api_executor("drive").execute(
+            self.service.files().list(
+                q=query, pageSize=5, fields="files(id, name, mimeType, modifiedTime)"
+            )
         )
         files = results.get("files", [])
         return files[0] if files else None
@@ -364,18 +1584,230 @@ class GoogleDriveSync:
     def _export_spreadsheet_as_csv(self, file_id: str, file_path: str):
         request = self.service.files().export_media(fileId=file_id, mimeType="text/csv")
         with open(file_path, "wb") as fh:
-            downloader = MediaIoBaseDownload(fh, request)
+            downloader = google_api().MediaIoBaseDownload(fh, request)
             done = False
             while done is False:
-                status, done = downloader.next_chunk()
+                status, done = api_executor("drive").call(downloader.next_chunk)
 
     def _download_file(self, file_id, file_path):
-        request = self.service.files().get_media(fileId=file_id)
         with open(file_path, "wb") as fh:
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-            while done is False:
-                status, done = downloader.next_chunk()
+            fetch_drive_media(self.service, file_id, fh)
+
+
+# Windows 파일 이름에 쓸 수 없는 문자 (경로 구분자, 제어 문자 포함)
+INVALID_NAME_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def safe_local_name(name):
+    """Drive 이름을 로컬 파일/폴더 이름으로 쓸 수 있게 바꿉니다.
+
+    쓸 수 없는 문자는 "_"로 바꾸고 끝의 점/공백은 지웁니다. "."/".."처럼
+    다른 위치를 가리키는 이름이나 빈 이름은 "_"가 됩니다.
+    """
+    name = INVALID_NAME_CHARS.sub("_", name).rstrip(". ")
+    return name or "_"
+
+
+def is_inside_dir(root, path):
+    """path가 root 폴더 안(하위 포함)을 가리키는지."""
+    root = os.path.normcase(os.path.abspath(root))
+    path = os.path.normcase(os.path.abspath(path))
+    try:
+        return os.path.commonpath([root, path]) == root and path != root
+    except ValueError:  # 다른 드라이브
+        return False
+
+
+def fetch_drive_media(service, file_id, fh):
+    """Drive 파일 내용을 열린 파일 객체에 씁니다."""
+    request = service.files().get_media(fileId=file_id)
+    downloader = google_api().MediaIoBaseDownload(fh, request)
+    done = False
+    while done is False:
+        status, done = api_executor("drive").call(downloader.next_chunk)
+
+
+# --- [Drive 병렬 다운로드] ---
+class DriveSyncManifest:
+    """악보 동기화 상태 파일 (app_dir/drive_sync_manifest.json).
+
+    - files: 받아 둔 파일 (Drive id -> 이름, 경로, 크기, md5Checksum, modifiedTime)
+    - pending: 받아야 하지만 아직 끝나지 않은 파일 (끊긴 동기화를 이어받을 때 사용)
+    - page_token: Drive changes API 시작 토큰 (다음 동기화는 이후 변경분만 조회)
+    - folders: 폴더 id -> {"parent": 상위 폴더 id, "name": 로컬 이름}
+      경로는 저장하지 않고 그때그때 최상위까지 따라 올라가 만듭니다. 그래서 중간 폴더의
+      이름이 바뀌거나 밖으로 옮겨지면 그 아래 항목도 함께 새 위치/트리 밖으로 처리됩니다.
+    폴더 id가 바뀌면 새로 시작합니다.
+    """
+
+    def __init__(self, path, folder_id):
+        self.path = path
+        self.folder_id = folder_id
+        self.files = {}
+        self.pending = {}
+        self.page_token = None
+        self.folders = {folder_id: {"parent": None, "name": ""}}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"동기화 기록 읽기 오류 (새로 시작): {e}")
+            return
+        if data.get("folder_id") == self.folder_id:
+            self.files = data.get("files", {})
+            self.pending = data.get("pending", {})
+            folders = data.get("folders", {})
+            if all(isinstance(node, dict) for node in folders.values()):
+                self.page_token = data.get("page_token")
+                self.folders.update(folders)
+            # 예전 형식(id -> 경로)이면 폴더 구조는 전체 조회로 다시 만듦
+
+    def save(self):
+        data = {
+            "folder_id": self.folder_id,
+            "page_token": self.page_token,
+            "folders": self.folders,
+            "files": self.files,
+            "pending": self.pending,
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def folder_path(self, folder_id):
+        """폴더의 로컬 상대경로 (최상위는 ""). 동기화 트리에 닿지 않으면 None."""
+        parts = []
+        seen = set()
+        while folder_id != self.folder_id:
+            node = self.folders.get(folder_id)
+            if node is None or folder_id in seen:
+                return None
+            seen.add(folder_id)
+            parts.append(node["name"])
+            folder_id = node["parent"]
+        return os.path.join(*reversed(parts)) if parts else ""
+
+    def prune_folders(self):
+        """최상위까지 이어지지 않는 폴더(삭제/트리 밖으로 이동된 폴더의 하위 포함)를 지웁니다."""
+        for folder_id in [f for f in self.folders if self.folder_path(f) is None]:
+            del self.folders[folder_id]
+
+    def local_rel_path(self, item):
+        """항목의 로컬 상대경로. 동기화 폴더 밖의 항목이면 None."""
+        for parent in item.get("parents") or []:
+            parent_path = self.folder_path(parent)
+            if parent_path is not None:
+                return os.path.join(parent_path, safe_local_name(item["name"]))
+        return None
+
+    def needs_download(self, item, local_path):
+        record = self.files.get(item["id"])
+        if not os.path.exists(local_path):
+            return True
+        if record is None:
+            # 기록 없이 로컬에 있던 파일은 Drive 파일과 같은지 확인 (교체된 스캔본이면 받음)
+            return not self.local_matches(item, local_path)
+        new_md5 = item.get("md5Checksum")
+        if new_md5 and record.get("md5Checksum"):
+            return new_md5 != record["md5Checksum"]
+        return item.get("modifiedTime") != record.get("modifiedTime")
+
+    @staticmethod
+    def local_matches(item, local_path):
+        """로컬 파일이 Drive 파일과 같은지 크기, 그다음 md5Checksum으로 비교합니다."""
+        try:
+            size = os.path.getsize(local_path)
+            if item.get("size") is not None and int(item["size"]) != size:
+                return False
+            remote_md5 = item.get("md5Checksum")
+            if not remote_md5:
+                return True
+            digest = hashlib.md5()
+            with open(local_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except (OSError, ValueError):
+            return False
+        return digest.hexdigest() == remote_md5
+
+    def mark_done(self, item, rel_path):
+        self.pending.pop(item["id"], None)
+        self.files[item["id"]] = {
+            "name": item.get("name", ""),
+            "path": rel_path,
+            "size": item.get("size"),
+            "md5Checksum": item.get("md5Checksum"),
+            "modifiedTime": item.get("modifiedTime"),
+        }
+
+    def forget(self, file_id):
+        self.files.pop(file_id, None)
+        self.pending.pop(file_id, None)
+
+
+class DriveDownloadEngine:
+    """작업자 스레드 여러 개로 Drive 파일을 동시에 내려받습니다.
+
+    - 작업자마다 service_factory()로 만든 서비스 객체를 따로 씁니다.
+    - 임시 파일(.part)에 받은 뒤 os.replace로 바꿔, 끊겨도 깨진 파일이 남지 않습니다.
+    - service_factory/fetch를 바꿔 끼우면 로컬 가짜 Drive로도 돌려볼 수 있습니다.
+    """
+
+    PART_SUFFIX = ".part"
+
+    def __init__(self, service_factory, max_workers=4, fetch=fetch_drive_media):
+        self.service_factory = service_factory
+        self.max_workers = max(1, max_workers)
+        self.fetch = fetch
+        self._local = threading.local()
+
+    def _service(self):
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self.service_factory()
+            self._local.service = service
+        return service
+
+    def download(self, file_id, local_path):
+        os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
+        part_path = local_path + self.PART_SUFFIX
+        try:
+            with open(part_path, "wb") as fh:
+                self.fetch(self._service(), file_id, fh)
+            os.replace(part_path, local_path)
+        except BaseException:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            raise
+
+    def run(self, jobs, on_done, should_stop=None):
+        """jobs: [(item, local_path)]. 파일 하나가 끝날 때마다 호출한 스레드에서
+        on_done(item, local_path, error)를 부릅니다. 완료한 개수를 돌려줍니다."""
+        completed = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self.download, item["id"], local_path): (item, local_path)
+                for item, local_path in jobs
+            }
+            for future in as_completed(futures):
+                item, local_path = futures[future]
+                error = future.exception()
+                if error is None:
+                    completed += 1
+                on_done(item, local_path, error)
+                if should_stop is not None and should_stop():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return completed
 
 
 # --- [Google Drive + Sheets(쓰기) 연동] ---
@@ -397,30 +1829,42 @@ class GoogleWorkspaceSync:
         if not GOOGLE_LIB_AVAILABLE:
             return False
         try:
-            creds = service_account.Credentials.from_service_account_file(
-                self.service_account_file, scopes=self.SCOPES
+            self.drive = google_clients.acquire(
+                "drive", "v3", self.service_account_file, self.SCOPES
+            )
+            self.sheets = google_clients.acquire(
+                "sheets", "v4", self.service_account_file, self.SCOPES
             )
-            self.drive = build("drive", "v3", credentials=creds)
-            self.sheets = build("sheets", "v4", credentials=creds)
             return True
         except Exception as e:
             print(f"연결 실패: {e}")
+            self.close()
             return False
 
+    def close(self):
+        """빌린 서비스 객체를 반납합니다."""
+        for service in (self.drive, self.sheets):
+            if service is not None:
+                google_clients.release(service)
+        self.drive = None
+        self.sheets = None
+
     def find_file_in_folder_by_name(self, file_name: str):
         if not self.drive:
             return None
         query = f"'{self.drive_folder_id}' in parents and trashed=false and name='{file_name}'"
-        results = (
-            self.drive.files()
-            .list(q=query, pageSize=5, fields="files(id, name, mimeType, modifiedTime)")
-            .execute()
+        results = api_executor("drive").execute(
+            self.drive.files().list(
+                q=query, pageSize=5, fields="files(id, name, mimeType, modifiedTime)"
+            )
         )
         files = results.get("files", [])
         return files[0] if files else None
 
     def get_first_sheet_title(self, spreadsheet_id: str) -> str:
-        meta = self.sheets.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        meta = api_executor("sheets").execute(
+            self.sheets.spreadsheets().get(spreadsheetId=spreadsheet_id)
+        )
         sheets = meta.get("sheets", [])
         if not sheets:
             return "Sheet1"
@@ -428,6 +1872,35 @@ class GoogleWorkspaceSync:
         return props.get("title", "Sheet1")
 
 
+# --- [Sheets 쓰기 분할] ---
+# values.batchUpdate/append 한 번에 보낼 양 (요청 크기 제한보다 넉넉히 작게)
+SHEET_WRITE_MAX_ROWS = 200
+SHEET_WRITE_MAX_BYTES = 1024 * 1024
+_UPDATED_RANGE_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+
+
+def chunk_sheet_rows(items, values_of, max_rows=SHEET_WRITE_MAX_ROWS, max_bytes=SHEET_WRITE_MAX_BYTES):
+    """행 목록을 행 수/대략적인 바이트 크기 제한에 맞춰 나눕니다."""
+    chunk = []
+    size = 0
+    for item in items:
+        item_size = sum(len(str(v).encode("utf-8")) for v in values_of(item)) + 64
+        if chunk and (len(chunk) >= max_rows or size + item_size > max_bytes):
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append(item)
+        size += item_size
+    if chunk:
+        yield chunk
+
+
+def first_row_of_range(a1_range):
+    """'Sheet1!A5:E7' -> 5 (알 수 없으면 None)."""
+    match = _UPDATED_RANGE_ROW_RE.search(a1_range or "")
+    return int(match.group(1)) if match else None
+
+
 # --- [동기화 진행 상황 다이얼로그] ---
 class SyncProgressDialog(QDialog):
     def __init__(self, parent=None):
@@ -445,6 +1918,16 @@ class SyncProgressDialog(QDialog):
         self.progress_bar.setRange(0, 0)
         layout.addWidget(self.progress_bar)
 
+        # 이 창을 연 뒤의 Google API 요청 지표 (요청/재시도/지연 시간)
+        self.metrics_label = QLabel("")
+        self.metrics_label.setStyleSheet("color: #666; font-size: 9pt;")
+        self.metrics_label.setWordWrap(True)
+        layout.addWidget(self.metrics_label)
+        self._metrics_baseline = start_metrics_window()
+        self._metrics_timer = QTimer(self)
+        self._metrics_timer.timeout.connect(self.refresh_metrics)
+        self._metrics_timer.start(500)
+
         self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
         layout.addWidget(self.log_view)
@@ -465,7 +1948,17 @@ class SyncProgressDialog(QDialog):
         self.progress_bar.setValue(current)
         self.status_label.setText(f"진행 중: {current}/{total}")
 
+    def refresh_metrics(self):
+        self.metrics_label.setText(
+            format_metrics(metrics_snapshot(), self._metrics_baseline)
+        )
+
     def finish_sync(self, success, msg):
+        self._metrics_timer.stop()
+        self.refresh_metrics()
+        summary = self.metrics_label.text()
+        if summary:
+            self.append_log(f"API 요청: {summary}")
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(100)
         self.status_label.setText(msg)
@@ -479,9 +1972,90 @@ class SyncThread(QThread):
     log_signal = Signal(str)
     finished_signal = Signal(bool, int, str)  # db_updated 인자 제거
 
-    def __init__(self, sync_helper):
+    MANIFEST_NAME = "drive_sync_manifest.json"
+    MANIFEST_SAVE_EVERY = 20
+
+    def __init__(self, sync_helper, max_workers=4):
         super().__init__()
         self.sync_helper = sync_helper
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _is_sheet_file(item):
+        if "application/vnd.google-apps" in item.get("mimeType", ""):
+            return False
+        # DB 파일은 동기화 대상에서 제외 (별도 버튼으로 관리)
+        return item.get("name") != "song_metadata.db"
+
+    def _collect_items(self, manifest):
+        """이번에 검사할 Drive 파일 목록. 처음에는 하위 폴더까지 전체, 이후에는 변경분만."""
+        helper = self.sync_helper
+        if manifest.page_token:
+            self.log_signal.emit("마지막 동기화 이후 변경 사항을 확인하는 중...")
+            changes, new_token = helper.list_changes(manifest.page_token)
+            before = {f: manifest.folder_path(f) for f in manifest.folders}
+
+            # 폴더 변경을 먼저 모두 반영 (변경 순서와 관계없이 상위 폴더가 먼저 들어감)
+            changed_folders = []
+            for change in changes:
+                item = change.get("file")
+                if not item or item.get("mimeType") != helper.FOLDER_MIME:
+                    continue
+                if change.get("removed") or item.get("trashed"):
+                    manifest.folders.pop(change.get("fileId"), None)
+                    continue
+                manifest.folders[item["id"]] = {
+                    "parent": next(iter(item.get("parents") or []), None),
+                    "name": safe_local_name(item["name"]),
+                }
+                changed_folders.append(item["id"])
+            # 삭제/트리 밖으로 옮겨진 폴더는 하위 폴더까지 기록에서 지움
+            manifest.prune_folders()
+
+            items = []
+            for change in changes:
+                item = change.get("file")
+                if item and item.get("mimeType") == helper.FOLDER_MIME:
+                    continue
+                rel_path = None
+                if not change.get("removed") and item and not item.get("trashed"):
+                    rel_path = manifest.local_rel_path(item)
+                if rel_path is None:
+                    # 삭제/이동된 항목은 기록만 지움 (로컬 파일은 그대로 둠)
+                    manifest.forget(change.get("fileId"))
+                else:
+                    items.append(item)
+
+            # 새로 들어왔거나 위치/이름이 바뀐 폴더는 안의 기존 파일이 변경 목록에
+            # 나오지 않으므로 그 폴더 아래를 직접 훑음 (상위가 함께 바뀐 폴더는 상위에서 처리)
+            moved = [
+                f
+                for f in changed_folders
+                if f in manifest.folders and manifest.folder_path(f) != before.get(f)
+            ]
+            for folder_id in moved:
+                ancestor = manifest.folders[folder_id]["parent"]
+                while ancestor in manifest.folders and ancestor not in moved:
+                    ancestor = manifest.folders[ancestor]["parent"]
+                if ancestor in moved:
+                    continue
+                self.log_signal.emit(
+                    f"옮겨진 폴더 확인 중: {manifest.folder_path(folder_id)}"
+                )
+                sub_folders, sub_items = helper.walk_tree(folder_id, self.max_workers)
+                sub_folders.pop(folder_id)
+                manifest.folders.update(sub_folders)
+                items.extend(sub_items)
+            self.log_signal.emit(f"변경 {len(changes)}건 확인")
+            return items, new_token
+
+        # 목록을 받는 동안 생긴 변경도 놓치지 않도록 토큰을 먼저 받아 둠
+        new_token = helper.get_start_page_token()
+        self.log_signal.emit("하위 폴더를 포함한 전체 파일 목록을 받아오는 중...")
+        folders, items = helper.walk_tree(helper.drive_folder_id, self.max_workers)
+        manifest.folders = folders
+        self.log_signal.emit(f"폴더 {len(folders)}개, 파일 {len(items)}개 확인")
+        return items, new_token
 
     def run(self):
         try:
@@ -490,72 +2064,178 @@ class SyncThread(QThread):
                 self.finished_signal.emit(
                     False, 0, "구글 인증 실패: service_account.json 확인"
                 )
-                return
-
-            self.log_signal.emit("전체 파일 목록을 받아오는 중...")
-            items = []
-            page_token = None
-            query = f"'{self.sync_helper.drive_folder_id}' in parents and trashed=false"
-
-            while True:
-                results = (
-                    self.sync_helper.service.files()
-                    .list(
-                        q=query,
-                        pageSize=1000,
-                        fields="nextPageToken, files(id, name, mimeType, modifiedTime)",
-                        pageToken=page_token,
-                    )
-                    .execute()
-                )
+                return
 
-                items.extend(results.get("files", []))
-                page_token = results.get("nextPageToken")
-                if not page_token:
-                    break
+            local_dir = self.sync_helper.local_dir
+            manifest = DriveSyncManifest(
+                os.path.join(self.sync_helper.app_dir, self.MANIFEST_NAME),
+                self.sync_helper.drive_folder_id,
+            )
+            items, new_token = self._collect_items(manifest)
+            # 지난번에 끝내지 못한 파일도 다시 시도
+            candidates = {item["id"]: item for item in manifest.pending.values()}
+            candidates.update(
+                (item["id"], item) for item in items if self._is_sheet_file(item)
+            )
 
-            download_list = []
-            # DB 파일(song_metadata.db) 관련 로직 삭제됨
-            for item in items:
-                if "application/vnd.google-apps" in item["mimeType"]:
+            # Drive 폴더 구조를 로컬에 그대로 만듦 (빈 폴더 포함)
+            for folder_id in manifest.folders:
+                folder_path = os.path.join(local_dir, manifest.folder_path(folder_id))
+                if folder_id != manifest.folder_id and not is_inside_dir(
+                    local_dir, folder_path
+                ):
+                    self.log_signal.emit(f"❌ 건너뜀 (동기화 폴더 밖): {folder_path}")
                     continue
+                try:
+                    os.makedirs(folder_path, exist_ok=True)
+                except OSError as e:
+                    self.log_signal.emit(f"❌ 폴더 생성 실패: {folder_path} - {e}")
 
-                file_name = item["name"]
-                # DB 파일은 동기화 대상에서 제외 (별도 버튼으로 관리)
-                if file_name == "song_metadata.db":
+            download_list = []
+            for item in candidates.values():
+                rel_path = manifest.local_rel_path(item)
+                if rel_path is None:
+                    manifest.pending.pop(item["id"], None)
+                    continue
+                local_path = os.path.join(local_dir, rel_path)
+                if not is_inside_dir(local_dir, local_path):
+                    self.log_signal.emit(f"❌ 건너뜀 (동기화 폴더 밖): {item['name']}")
+                    manifest.pending.pop(item["id"], None)
                     continue
+                if manifest.needs_download(item, local_path):
+                    download_list.append((item, local_path))
+                elif item["id"] not in manifest.files:
+                    # 내용이 같은 파일이 이미 로컬에 있으면 받지 않고 기록만 함 (이후 변경 시 갱신)
+                    manifest.mark_done(item, os.path.relpath(local_path, local_dir))
+                else:
+                    manifest.pending.pop(item["id"], None)
 
-                local_path = os.path.join(self.sync_helper.local_dir, file_name)
-                if not os.path.exists(local_path):
-                    download_list.append(item)
+            # 받을 목록을 먼저 기록한 뒤 토큰을 넘기므로, 중간에 끊겨도 다음에 이어받음
+            manifest.pending = {item["id"]: item for item, _path in download_list}
+            manifest.page_token = new_token
+            manifest.save()
 
             total_actions = len(download_list)
-            download_count = 0
-
-            for item in download_list:
-                download_count += 1
-                file_name = item["name"]
-                local_path = os.path.join(self.sync_helper.local_dir, file_name)
-
-                self.log_signal.emit(f"[다운로드] {file_name}")
-                self.progress_signal.emit(download_count, total_actions)
+            finished = 0
+            if total_actions:
+                self.log_signal.emit(
+                    f"{total_actions}개 파일을 {self.max_workers}개 작업자로 내려받습니다."
+                )
 
-                try:
-                    self.sync_helper._download_file(item["id"], local_path)
-                except Exception as e:
-                    self.log_signal.emit(f"❌ 실패: {file_name} - {e}")
+            def on_done(item, local_path, error):
+                nonlocal finished
+                finished += 1
+                self.progress_signal.emit(finished, total_actions)
+                if error is not None:
+                    self.log_signal.emit(f"❌ 실패: {item['name']} - {error}")
+                    return
+                self.log_signal.emit(f"[다운로드] {item['name']}")
+                manifest.mark_done(item, os.path.relpath(local_path, local_dir))
+                # 중간에 끊겨도 이어받을 수 있도록 주기적으로 기록
+                if finished % self.MANIFEST_SAVE_EVERY == 0:
+                    manifest.save()
+
+            engine = DriveDownloadEngine(
+                self.sync_helper.build_service, max_workers=self.max_workers
+            )
+            try:
+                download_count = engine.run(
+                    download_list, on_done, self.isInterruptionRequested
+                )
+            finally:
+                manifest.save()
 
             final_msg = "악보 파일 동기화가 완료되었습니다."
             if download_count == 0:
-                final_msg = f"총 {len(items)}개 파일 확인됨. (새로운 악보 없음)"
+                final_msg = f"총 {len(items)}개 항목 확인됨. (새로운 악보 없음)"
 
             self.finished_signal.emit(True, download_count, final_msg)
 
         except Exception as e:
             self.finished_signal.emit(False, 0, f"오류 발생: {str(e)}")
+        finally:
+            self.sync_helper.close()
 
 
 # --- [플레이리스트 Google Sheets 동기화 스레드] ---
+def playlist_content_hash(text):
+    """플레이리스트 내용 해시 (시트 D열과 동기화 기록에 저장)."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class PlaylistSyncManifest:
+    """플레이리스트 동기화 기록 (app_dir/playlist_sync_manifest.json).
+
+    playlists: 이름 -> 마지막으로 시트와 맞춘 내용 해시와 그때 로컬 파일의 크기/수정 시각.
+    크기/수정 시각이 그대로면 파일을 다시 읽지 않고 기록된 해시를 씁니다.
+    스프레드시트 id나 로컬 플레이리스트 폴더가 바뀌면 새로 시작합니다.
+    """
+
+    def __init__(self, path, spreadsheet_id, local_root):
+        self.path = path
+        self.spreadsheet_id = spreadsheet_id
+        self.local_root = os.path.normcase(os.path.abspath(local_root))
+        self.playlists = {}
+        self.load()
+
+    def load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"플레이리스트 동기화 기록 읽기 오류 (새로 시작): {e}")
+            return
+        if (
+            data.get("spreadsheet_id") == self.spreadsheet_id
+            and data.get("local_root") == self.local_root
+        ):
+            self.playlists = data.get("playlists", {})
+
+    def save(self):
+        if not self.path:
+            return
+        data = {
+            "spreadsheet_id": self.spreadsheet_id,
+            "local_root": self.local_root,
+            "playlists": self.playlists,
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def synced_hash(self, name):
+        record = self.playlists.get(name)
+        return record.get("hash") if record else None
+
+    def local_hash(self, name, local_path):
+        """로컬 파일 내용 해시 (없으면 None). 기록과 크기/수정 시각이 같으면 읽지 않음."""
+        try:
+            st = os.stat(local_path)
+        except OSError:
+            return None
+        record = self.playlists.get(name)
+        if record and record.get("size") == st.st_size and record.get("mtime") == st.st_mtime:
+            return record.get("hash")
+        with open(local_path, "r", encoding="utf-8") as f:
+            return playlist_content_hash(f.read())
+
+    def mark_synced(self, name, local_path, content_hash):
+        try:
+            st = os.stat(local_path)
+        except OSError:
+            return
+        self.playlists[name] = {
+            "hash": content_hash,
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+        }
+
+
 class PlaylistSyncThread(QThread):
     """로컬 플레이리스트(.pls)를 구글 스프레드시트와 동기화합니다."""
 
@@ -563,29 +2243,43 @@ class PlaylistSyncThread(QThread):
     progress_signal = Signal(int, int)
     finished_signal = Signal(bool, int, str)  # success, count, message
 
-    HEADER = ["playlist_name", "playlist_data", "updated_at"]
+    HEADER = ["playlist_name", "playlist_data", "updated_at", "content_hash"]
+    MANIFEST_NAME = "playlist_sync_manifest.json"
+    BODY_BATCH = 100  # batchGet 한 번에 읽을 본문 셀 수
+    IO_WORKERS = 4  # 로컬 파일 읽기/쓰기 작업자 수
 
-    def __init__(self, service_account_file, spreadsheet_id, local_playlist_path, mode="download"):
+    def __init__(
+        self,
+        service_account_file,
+        spreadsheet_id,
+        local_playlist_path,
+        mode="download",
+        manifest_path=None,
+    ):
         super().__init__()
         self.service_account_file = service_account_file
         self.spreadsheet_id = spreadsheet_id
         self.local_playlist_path = local_playlist_path
         self.mode = mode  # "download" or "upload"
         self.sheets = None
+        self.manifest = PlaylistSyncManifest(
+            manifest_path, spreadsheet_id, local_playlist_path
+        )
 
     def _connect(self):
         if not GOOGLE_LIB_AVAILABLE:
             return False
         scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        creds = service_account.Credentials.from_service_account_file(
-            self.service_account_file, scopes=scopes
+        self.sheets = google_clients.acquire(
+            "sheets", "v4", self.service_account_file, scopes
         )
-        self.sheets = build("sheets", "v4", credentials=creds)
         return True
 
     def _get_tab_title(self):
         """스프레드시트의 첫 번째 시트 탭 이름을 가져옵니다."""
-        meta = self.sheets.spreadsheets().get(spreadsheetId=self.spreadsheet_id).execute()
+        meta = api_executor("sheets").execute(
+            self.sheets.spreadsheets().get(spreadsheetId=self.spreadsheet_id)
+        )
         sheets = meta.get("sheets", [])
         if not sheets:
             return "Sheet1"
@@ -594,34 +2288,66 @@ class PlaylistSyncThread(QThread):
     def _ensure_header(self):
         """시트에 헤더가 없으면 생성합니다."""
         tab = self.tab_title
-        resp = self.sheets.spreadsheets().values().get(
-            spreadsheetId=self.spreadsheet_id, range=f"{tab}!A1:C1"
-        ).execute()
+        resp = api_executor("sheets").execute(
+            self.sheets.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id, range=f"{tab}!A1:D1"
+            )
+        )
         values = resp.get("values", [])
         if not values or values[0] != self.HEADER:
-            self.sheets.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{tab}!A1:C1",
-                valueInputOption="RAW",
-                body={"values": [self.HEADER]},
-            ).execute()
+            api_executor("sheets").execute(
+                self.sheets.spreadsheets().values().update(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{tab}!A1:D1",
+                    valueInputOption="RAW",
+                    body={"values": [self.HEADER]},
+                ),
+                log=self.log_signal.emit,
+            )
+
+    def _read_index(self):
+        """시트의 이름(A열)과 내용 해시(D열)만 읽습니다. {name: (row_no, content_hash, updated_at)}
 
-    def _read_all_rows(self):
-        """시트의 모든 데이터 행을 읽습니다. {name: (row_index, data_json, updated_at)}"""
+        본문(B열)은 읽지 않으므로 플레이리스트가 많아도 가볍습니다.
+        """
         tab = self.tab_title
-        resp = self.sheets.spreadsheets().values().get(
-            spreadsheetId=self.spreadsheet_id, range=f"{tab}!A:C"
-        ).execute()
-        values = resp.get("values", [])
+        resp = api_executor("sheets").execute(
+            self.sheets.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=[f"{tab}!A:A", f"{tab}!C:D"],
+            ),
+            log=self.log_signal.emit,
+        )
+        ranges = resp.get("valueRanges", [])
+        names = ranges[0].get("values", []) if ranges else []
+        extras = ranges[1].get("values", []) if len(ranges) > 1 else []
         result = {}
-        for i, row in enumerate(values[1:], start=2):  # 헤더 제외, 1-based row
-            if len(row) >= 2 and row[0].strip():
-                name = row[0].strip()
-                data = row[1] if len(row) >= 2 else ""
-                updated = row[2] if len(row) >= 3 else ""
-                result[name] = (i, data, updated)
+        for i, row in enumerate(names[1:], start=2):  # 헤더 제외, 1-based row
+            if row and row[0].strip():
+                extra = extras[i - 1] if i - 1 < len(extras) else []
+                updated = extra[0] if len(extra) >= 1 else ""
+                content_hash = extra[1].strip() if len(extra) >= 2 else ""
+                result[row[0].strip()] = (i, content_hash, updated)
         return result
 
+    def _read_bodies(self, row_numbers):
+        """지정한 행들의 본문(B열)만 읽습니다. {row_no: data_json}"""
+        tab = self.tab_title
+        bodies = {}
+        row_numbers = list(row_numbers)
+        for start in range(0, len(row_numbers), self.BODY_BATCH):
+            batch = row_numbers[start : start + self.BODY_BATCH]
+            resp = api_executor("sheets").execute(
+                self.sheets.spreadsheets().values().batchGet(
+                    spreadsheetId=self.spreadsheet_id,
+                    ranges=[f"{tab}!B{row_no}" for row_no in batch],
+                ),
+                log=self.log_signal.emit,
+            )
+            for row_no, vr in zip(batch, resp.get("valueRanges", [])):
+                bodies[row_no] = ((vr.get("values") or [[]])[0] or [""])[0]
+        return bodies
+
     def run(self):
         try:
             self.log_signal.emit("Google Sheets에 연결 중...")
@@ -641,75 +2367,181 @@ class PlaylistSyncThread(QThread):
 
         except Exception as e:
             self.finished_signal.emit(False, 0, f"오류 발생: {str(e)}")
+        finally:
+            if self.sheets is not None:
+                google_clients.release(self.sheets)
+                self.sheets = None
+
+    def _collect_local(self):
+        """플레이리스트 폴더 아래(하위 폴더 포함) .pls 파일. {상대경로('/' 구분): 전체 경로}"""
+        found = {}
+        for root, _dirs, files in os.walk(self.local_playlist_path):
+            for f in files:
+                if f.lower().endswith(".pls"):
+                    full = os.path.join(root, f)
+                    rel = os.path.relpath(full, self.local_playlist_path)
+                    found[rel.replace(os.sep, "/")] = full
+        return dict(sorted(found.items()))
+
+    def _local_path(self, pls_name):
+        """시트의 이름(상대경로)을 로컬 경로로. 폴더 밖을 가리키면 None."""
+        parts = [part for part in pls_name.split("/") if part]
+        if not parts or any(
+            part in (".", "..") or ":" in part or "\\" in part for part in parts
+        ):
+            return None
+        return os.path.join(self.local_playlist_path, *parts)
+
+    def _hash_local_files(self, paths):
+        """{이름: 로컬 경로}의 내용 해시를 작업자 스레드로 구합니다. {이름: 해시 또는 None}"""
+
+        def local_hash(item):
+            pls_name, local_path = item
+            try:
+                return self.manifest.local_hash(pls_name, local_path)
+            except Exception as e:
+                self.log_signal.emit(f"[오류] {pls_name}: {e}")
+                return False  # 읽기 실패 (없음과 구분)
+
+        hashes = {}
+        with ThreadPoolExecutor(max_workers=self.IO_WORKERS) as pool:
+            for i, (pls_name, result) in enumerate(
+                zip(paths, pool.map(local_hash, paths.items())), 1
+            ):
+                self.progress_signal.emit(i, len(paths))
+                if result is not False:
+                    hashes[pls_name] = result
+        return hashes
 
     def _run_upload(self):
-        local_files = [
-            f for f in os.listdir(self.local_playlist_path)
-            if f.lower().endswith(".pls")
-        ]
+        local_files = self._collect_local()
         if not local_files:
             self.finished_signal.emit(True, 0, "업로드할 플레이리스트가 없습니다.")
             return
 
         self.log_signal.emit(f"로컬 플레이리스트 {len(local_files)}개 발견")
-        self.log_signal.emit("시트 기존 데이터 확인 중...")
-        existing = self._read_all_rows()
 
-        updates = []
-        appends = []
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # 마지막 동기화 이후 내용이 바뀐 것만 후보로
+        hashes = self._hash_local_files(local_files)
+        changed = [
+            pls_name
+            for pls_name, local_hash in hashes.items()
+            if local_hash is not None and local_hash != self.manifest.synced_hash(pls_name)
+        ]
+        if not changed:
+            self.finished_signal.emit(
+                True, 0, f"총 {len(local_files)}개 확인됨. (바뀐 플레이리스트 없음)"
+            )
+            return
 
-        for i, fname in enumerate(local_files, 1):
-            local_path = os.path.join(self.local_playlist_path, fname)
-            self.progress_signal.emit(i, len(local_files))
+        self.log_signal.emit(f"바뀐 플레이리스트 {len(changed)}개, 시트 목록 확인 중...")
+        existing = self._read_index()
 
+        def read_text(pls_name):
             try:
-                with open(local_path, "r", encoding="utf-8") as f:
-                    data_json = f.read()
+                with open(local_files[pls_name], "r", encoding="utf-8") as f:
+                    return f.read()
             except Exception as e:
-                self.log_signal.emit(f"[오류] {fname}: {e}")
-                continue
+                self.log_signal.emit(f"[오류] {pls_name}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.IO_WORKERS) as pool:
+            contents = dict(zip(changed, pool.map(read_text, changed)))
+
+        updates = []
+        appends = []
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            pls_name = fname  # 파일명을 키로 사용
-            record = [pls_name, data_json, now]
+        for pls_name in changed:  # 상대경로를 키로 사용
+            data_json = contents[pls_name]
+            if data_json is None:
+                continue
+            content_hash = playlist_content_hash(data_json)
+            record = [pls_name, data_json, now, content_hash]
 
             if pls_name in existing:
-                row_no = existing[pls_name][0]
+                row_no, sheet_hash, _ = existing[pls_name]
+                if sheet_hash == content_hash:
+                    self.log_signal.emit(f"[최신] {pls_name}")
+                    self.manifest.mark_synced(pls_name, local_files[pls_name], content_hash)
+                    continue
                 updates.append((row_no, record))
-                self.log_signal.emit(f"[업데이트] {fname}")
+                self.log_signal.emit(f"[업데이트] {pls_name}")
             else:
                 appends.append(record)
-                self.log_signal.emit(f"[업로드] {fname}")
+                self.log_signal.emit(f"[업로드] {pls_name}")
 
+        # 요청 크기 제한에 맞춰 나눠 쓰고, 조각마다 기록 저장 (중간에 끊겨도 남은 것만 다시 올림)
         written = 0
-        if updates:
+        for chunk in chunk_sheet_rows(updates, lambda u: u[1]):
             data = [
-                {"range": f"{self.tab_title}!A{row_no}:C{row_no}", "values": [record]}
-                for row_no, record in updates
+                {"range": f"{self.tab_title}!A{row_no}:D{row_no}", "values": [record]}
+                for row_no, record in chunk
             ]
-            self.sheets.spreadsheets().values().batchUpdate(
-                spreadsheetId=self.spreadsheet_id,
-                body={"valueInputOption": "RAW", "data": data},
-            ).execute()
-            written += len(updates)
+            api_executor("sheets").execute(
+                self.sheets.spreadsheets().values().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={"valueInputOption": "RAW", "data": data},
+                ),
+                log=self.log_signal.emit,
+            )
+            self._mark_uploaded(local_files, [record for _, record in chunk])
+            written += len(chunk)
+
+        for chunk in chunk_sheet_rows(appends, lambda record: record):
+            api_executor("sheets").execute(
+                self.sheets.spreadsheets().values().append(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f"{self.tab_title}!A:D",
+                    valueInputOption="RAW",
+                    insertDataOption="INSERT_ROWS",
+                    body={"values": chunk},
+                ),
+                log=self.log_signal.emit,
+                idempotent=False,  # 다시 보내면 행이 두 번 추가됨
+            )
+            self._mark_uploaded(local_files, chunk)
+            written += len(chunk)
 
-        if appends:
-            self.sheets.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.tab_title}!A:C",
-                valueInputOption="RAW",
-                insertDataOption="INSERT_ROWS",
-                body={"values": appends},
-            ).execute()
-            written += len(appends)
+        self.manifest.save()
 
         self.finished_signal.emit(
             True, written, f"플레이리스트 {written}개 업로드 완료"
         )
 
+    def _mark_uploaded(self, local_files, records):
+        for pls_name, _data, _updated, content_hash in records:
+            self.manifest.mark_synced(pls_name, local_files[pls_name], content_hash)
+        self.manifest.save()
+
+    def _sheet_is_newer(self, updated_at, local_path):
+        """예전 방식 비교: 시트 updated_at이 로컬 수정 시각보다 나중인지."""
+        try:
+            sheet_time = datetime.strptime(updated_at, "%Y-%m-%d %H:%M:%S")
+            local_time = datetime.fromtimestamp(os.path.getmtime(local_path))
+            return sheet_time > local_time
+        except (ValueError, OSError):
+            return True
+
+    def _write_playlist(self, local_path, data_json):
+        """임시 파일에 쓴 뒤 바꿔 넣습니다. 실패하면 예외 객체를 돌려줍니다."""
+        tmp_path = local_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data_json)
+            os.replace(tmp_path, local_path)
+            return None
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return e
+
     def _run_download(self):
         self.log_signal.emit("시트에서 플레이리스트 목록 확인 중...")
-        existing = self._read_all_rows()
+        existing = self._read_index()
 
         if not existing:
             self.finished_signal.emit(True, 0, "시트에 플레이리스트가 없습니다.")
@@ -717,34 +2549,74 @@ class PlaylistSyncThread(QThread):
 
         self.log_signal.emit(f"시트 플레이리스트 {len(existing)}개 발견")
 
+        local_paths = {}
+        for pls_name in existing:
+            local_path = self._local_path(pls_name)
+            if local_path is None:
+                self.log_signal.emit(f"[건너뜀] 잘못된 경로: {pls_name}")
+                continue
+            local_paths[pls_name] = local_path
+        local_hashes = self._hash_local_files(local_paths)
+
+        # 해시만으로 판단할 수 있는 것은 본문을 읽지 않음
+        fetch_rows = {}
+        for pls_name, local_hash in local_hashes.items():
+            row_no, sheet_hash, _ = existing[pls_name]
+            local_path = local_paths[pls_name]
+            if sheet_hash and sheet_hash == local_hash:
+                self.manifest.mark_synced(pls_name, local_path, local_hash)
+                continue
+            if sheet_hash and local_hash is not None and sheet_hash == self.manifest.synced_hash(pls_name):
+                # 시트는 그대로이고 로컬만 고침 (업로드 대기)
+                self.log_signal.emit(f"[로컬 수정] {pls_name}")
+                continue
+            fetch_rows[pls_name] = row_no
+
+        bodies = self._read_bodies(fetch_rows.values()) if fetch_rows else {}
+
+        to_write = []
+        for pls_name, row_no in fetch_rows.items():
+            local_path = local_paths[pls_name]
+            data_json = bodies.get(row_no, "")
+            content_hash = playlist_content_hash(data_json)
+            local_hash = local_hashes[pls_name]
+            updated_at = existing[pls_name][2]
+
+            if content_hash == local_hash:
+                self.manifest.mark_synced(pls_name, local_path, content_hash)
+                self.log_signal.emit(f"[최신] {pls_name}")
+                continue
+            if local_hash is not None:
+                synced = self.manifest.synced_hash(pls_name)
+                if synced == content_hash or (
+                    synced is None and not self._sheet_is_newer(updated_at, local_path)
+                ):
+                    self.log_signal.emit(f"[로컬 수정] {pls_name}")
+                    continue
+            to_write.append((pls_name, local_path, data_json, content_hash))
+
         downloaded = 0
-        for i, (pls_name, (row_no, data_json, updated_at)) in enumerate(existing.items(), 1):
-            self.progress_signal.emit(i, len(existing))
-            local_path = os.path.join(self.local_playlist_path, pls_name)
-
-            # 로컬에 없거나 시트가 더 새로우면 다운로드
-            need_download = False
-            if not os.path.exists(local_path):
-                need_download = True
-            elif updated_at:
-                try:
-                    sheet_time = datetime.strptime(updated_at, "%Y-%m-%d %H:%M:%S")
-                    local_time = datetime.fromtimestamp(os.path.getmtime(local_path))
-                    if sheet_time > local_time:
-                        need_download = True
-                except (ValueError, OSError):
-                    need_download = True
-
-            if need_download:
-                self.log_signal.emit(f"[다운로드] {pls_name}")
-                try:
-                    with open(local_path, "w", encoding="utf-8") as f:
-                        f.write(data_json)
+        with ThreadPoolExecutor(max_workers=self.IO_WORKERS) as pool:
+            futures = {
+                pool.submit(self._write_playlist, local_path, data_json): (
+                    pls_name,
+                    local_path,
+                    content_hash,
+                )
+                for pls_name, local_path, data_json, content_hash in to_write
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                pls_name, local_path, content_hash = futures[future]
+                self.progress_signal.emit(i, len(futures))
+                error = future.result()
+                if error is None:
+                    self.log_signal.emit(f"[다운로드] {pls_name}")
+                    self.manifest.mark_synced(pls_name, local_path, content_hash)
                     downloaded += 1
-                except Exception as e:
-                    self.log_signal.emit(f"[오류] {pls_name}: {e}")
-            else:
-                self.log_signal.emit(f"[최신] {pls_name}")
+                else:
+                    self.log_signal.emit(f"[오류] {pls_name}: {error}")
+
+        self.manifest.save()
 
         if downloaded == 0:
             msg = f"총 {len(existing)}개 확인됨. (새로운 플레이리스트 없음)"
@@ -760,12 +2632,22 @@ class MetadataSyncThread(QThread):
     log_signal = Signal(str)
     finished_signal = Signal(bool, int, str)
 
-    def __init__(self, sync_helper, csv_name, db_path, sheet_music_path):
+    def __init__(
+        self,
+        sync_helper,
+        csv_name,
+        db_path,
+        sheet_music_path,
+        sync_mode="incremental",
+        conflict_policy="lww",
+    ):
         super().__init__()
         self.sync_helper = sync_helper
         self.csv_name = csv_name
         self.db_path = db_path
         self.sheet_music_path = sheet_music_path
+        self.sync_mode = sync_mode
+        self.conflict_policy = conflict_policy
 
     def _ensure_db_columns(self, con: sqlite3.Connection):
         """기존 DB가 있을 때 컬럼이 부족하면 안전하게 추가합니다."""
@@ -814,8 +2696,7 @@ class MetadataSyncThread(QThread):
             self.log_signal.emit(f"다운로드 완료: {local_csv_path}")
 
             # 2) CSV 파싱 & DB 반영
-            updated_rows = 0
-            con = sqlite3.connect(self.db_path)
+            con = open_metadata_connection(self.db_path)
             cur = con.cursor()
 
             # 테이블이 없다면 생성(기존 init_database와 동일한 기본 구조 + 확장 컬럼)
@@ -836,61 +2717,33 @@ class MetadataSyncThread(QThread):
             # 기존 DB에 컬럼이 없을 수 있어 안전하게 보강
             self._ensure_db_columns(con)
 
-            with open(local_csv_path, "r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.DictReader(f)
-                # 필수 컬럼 체크(느슨하게 허용)
-                fieldnames = {c.strip() for c in (reader.fieldnames or [])}
-                if "file_path" not in fieldnames:
-                    self.finished_signal.emit(
-                        False, 0, "CSV에 'file_path' 컬럼이 없습니다."
+            # 바뀐 행만 조각 단위로 반영 (전체가 한 트랜잭션)
+            incremental = self.sync_mode != "full"
+            try:
+                result = import_metadata_csv(
+                    con,
+                    local_csv_path,
+                    self.sheet_music_path,
+                    log=self.log_signal.emit,
+                    conflict_policy=self.conflict_policy,
+                    incremental=incremental,
+                )
+            except ValueError as e:
+                con.close()
+                self.finished_signal.emit(False, 0, str(e))
+                return
+            updated_rows = result.applied
+            self.log_signal.emit(f"변경 없는 {result.skipped}행은 건너뜀")
+            if result.conflicts:
+                if self.conflict_policy == "keep_both":
+                    self.log_signal.emit(
+                        f"⚠ 로컬 미업로드 수정 {result.conflicts}건 유지, "
+                        "중앙 버전은 song_metadata_conflicts에 보관"
+                    )
+                else:
+                    self.log_signal.emit(
+                        f"⚠ 로컬 수정이 더 최근인 {result.conflicts}건은 유지 (다음 업로드 때 반영)"
                     )
-                    con.close()
-                    return
-
-                batch = []
-                now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                for row in reader:
-                    raw_path = (row.get("file_path") or "").strip()
-                    if not raw_path:
-                        continue
-                    # 상대경로로 정규화하여 저장
-                    rel_path = raw_path.replace("/", os.sep)
-                    if os.path.isabs(rel_path):
-                        try:
-                            base = os.path.normpath(self.sheet_music_path)
-                            p = os.path.normpath(rel_path)
-                            if p.lower().startswith(base.lower()):
-                                rel_path = os.path.relpath(p, base)
-                            else:
-                                rel_path = p
-                        except Exception:
-                            pass
-
-                    song_key = (row.get("song_key") or "").strip()
-                    lyrics = (row.get("lyrics") or "").strip()
-                    updated_at = (row.get("updated_at") or "").strip() or now
-                    updated_by = (row.get("updated_by") or "").strip()
-
-                    batch.append((rel_path, song_key, lyrics, updated_at, updated_by))
-                if batch:
-                    # dirty 여부와 관계없이 항상 온라인 CSV 기준으로 덮어씁니다.
-                    for rec in batch:
-                        cur.execute(
-                            """
-                            INSERT INTO song_metadata (file_path, song_key, lyrics, updated_at, updated_by, dirty)
-                            VALUES (?, ?, ?, ?, ?, 0)
-                            ON CONFLICT(file_path) DO UPDATE SET
-                                song_key=excluded.song_key,
-                                lyrics=excluded.lyrics,
-                                updated_at=excluded.updated_at,
-                                updated_by=excluded.updated_by,
-                                dirty=0
-                            """,
-                            rec,
-                        )
-                    con.commit()
-                    updated_rows = len(batch)
 
             con.close()
 
@@ -900,6 +2753,8 @@ class MetadataSyncThread(QThread):
 
         except Exception as e:
             self.finished_signal.emit(False, 0, f"DB 동기화 오류: {str(e)}")
+        finally:
+            self.sync_helper.close()
 
 
 # --- [로컬 -> 중앙(스프레드시트) 업로드 스레드] ---
@@ -909,6 +2764,8 @@ class MetadataUploadThread(QThread):
     log_signal = Signal(str)
     finished_signal = Signal(bool, int, str)
 
+    HEADER = ("file_path", "song_key", "lyrics", "updated_at", "updated_by")
+
     def __init__(
         self,
         ws_helper: GoogleWorkspaceSync,
@@ -950,6 +2807,86 @@ class MetadataUploadThread(QThread):
         except Exception:
             return abs_path.replace(os.sep, "/")
 
+    def _resolve_rows(self, con, spreadsheet_id, tab_title, path_keys):
+        """올릴 항목의 중앙 시트 행 번호를 찾습니다 (path_key -> 행 번호, 없으면 추가 대상).
+
+        캐시된 행 번호는 해당 A열 셀만 읽어 확인하고, 캐시에 없거나 어긋난 항목이
+        있을 때만 A열 전체(경로만, 가사 제외)를 읽어 캐시를 다시 만듭니다.
+        """
+        cached = dict(
+            con.execute(
+                "SELECT path_key, row_no FROM sheet_row_index WHERE spreadsheet_id=?",
+                (spreadsheet_id,),
+            ).fetchall()
+        )
+        wanted = {k: cached[k] for k in path_keys if k in cached}
+        sheet_values = self.ws_helper.sheets.spreadsheets().values()
+        if len(wanted) == len(path_keys) and len(wanted) <= 100:
+            self.log_signal.emit(f"중앙 시트 행 번호 확인 중 ({len(wanted)}건)...")
+            resp = api_executor("sheets").execute(
+                sheet_values.batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=[f"{tab_title}!A{row_no}" for row_no in wanted.values()],
+                ),
+                log=self.log_signal.emit,
+            )
+            cells = [
+                ((vr.get("values") or [[]])[0] or [""])[0]
+                for vr in resp.get("valueRanges", [])
+            ]
+            if len(cells) == len(wanted) and all(
+                metadata_path_key(str(cell).strip()) == k
+                for k, cell in zip(wanted, cells)
+            ):
+                return wanted
+
+        self.log_signal.emit("중앙 시트 경로 열(A열) 읽는 중...")
+        resp = api_executor("sheets").execute(
+            sheet_values.get(spreadsheetId=spreadsheet_id, range=f"{tab_title}!A:A"),
+            log=self.log_signal.emit,
+        )
+        column = resp.get("values", [])
+        if not column:
+            self.log_signal.emit("중앙 시트가 비어있어 헤더를 생성합니다.")
+            api_executor("sheets").execute(
+                sheet_values.update(
+                    spreadsheetId=spreadsheet_id,
+                    range=f"{tab_title}!A1:E1",
+                    valueInputOption="RAW",
+                    body={"values": [list(self.HEADER)]},
+                ),
+                log=self.log_signal.emit,
+            )
+
+        index = {}
+        for row_no, cell in enumerate(column[1:], start=2):
+            if cell and str(cell[0]).strip():
+                index[metadata_path_key(str(cell[0]).strip())] = row_no
+        with con:
+            con.execute(
+                "DELETE FROM sheet_row_index WHERE spreadsheet_id=?", (spreadsheet_id,)
+            )
+            con.executemany(
+                "INSERT INTO sheet_row_index (spreadsheet_id, path_key, row_no)"
+                " VALUES (?, ?, ?)",
+                [(spreadsheet_id, k, row_no) for k, row_no in index.items()],
+            )
+        return {k: index[k] for k in path_keys if k in index}
+
+    def _mark_uploaded(self, con, uploaded):
+        """올라간 조각마다 dirty=0으로 기록 (중간에 실패해도 다음에 남은 것만 올림).
+
+        uploaded: [(DB의 file_path, 시트에 쓴 행)]. 보관해 둔 충돌도 함께 지웁니다.
+        """
+        con.executemany(
+            "UPDATE song_metadata SET dirty=0 WHERE file_path=?",
+            [(abs_path,) for abs_path, _record in uploaded],
+        )
+        clear_metadata_conflicts(
+            con, [metadata_path_key(record[0]) for _abs_path, record in uploaded]
+        )
+        con.commit()
+
     def run(self):
         con = None
         try:
@@ -982,7 +2919,7 @@ class MetadataUploadThread(QThread):
             spreadsheet_id = item["id"]
             tab_title = self.ws_helper.get_first_sheet_title(spreadsheet_id)
 
-            con = sqlite3.connect(self.db_path)
+            con = open_metadata_connection(self.db_path)
             cur = con.cursor()
 
             cur.execute(
@@ -1015,87 +2952,81 @@ class MetadataUploadThread(QThread):
                 con.close()
                 return
 
-            self.log_signal.emit("중앙 시트 읽는 중(기존 데이터 확인)...")
-            header = ["file_path", "song_key", "lyrics", "updated_at", "updated_by"]
-            rng = f"{tab_title}!A:E"
-            resp = (
-                self.ws_helper.sheets.spreadsheets()
-                .values()
-                .get(spreadsheetId=spreadsheet_id, range=rng)
-                .execute()
-            )
-            values = resp.get("values", [])
-
-            if not values:
-                self.log_signal.emit("중앙 시트가 비어있어 헤더를 생성합니다.")
-                self.ws_helper.sheets.spreadsheets().values().update(
-                    spreadsheetId=spreadsheet_id,
-                    range=f"{tab_title}!A1:E1",
-                    valueInputOption="RAW",
-                    body={"values": [header]},
-                ).execute()
-                values = [header]
-
-            existing_map = {}
-            for idx_row, r in enumerate(values[1:], start=2):
-                if len(r) >= 1 and str(r[0]).strip():
-                    existing_map[str(r[0]).strip()] = idx_row
-
-            updates = []
-            appends = []
-            changed_abs_paths = []
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
+            records = {}
             for abs_path, song_key, lyrics, updated_at, updated_by in local_rows:
                 rel_path = self._to_rel_path(abs_path)
-                up_at = (updated_at or "").strip() or now
-                up_by = (updated_by or "").strip() or self.editor_name
-                record = [
-                    rel_path,
-                    (song_key or "").strip(),
-                    (lyrics or "").strip(),
-                    up_at,
-                    up_by,
-                ]
-
-                if rel_path in existing_map:
-                    row_no = existing_map[rel_path]
-                    updates.append((row_no, record))
-                else:
-                    appends.append(record)
+                records[metadata_path_key(rel_path)] = (
+                    abs_path,
+                    [
+                        rel_path,
+                        (song_key or "").strip(),
+                        (lyrics or "").strip(),
+                        (updated_at or "").strip() or now,
+                        (updated_by or "").strip() or self.editor_name,
+                    ],
+                )
 
-                changed_abs_paths.append(abs_path)
+            row_index = self._resolve_rows(con, spreadsheet_id, tab_title, list(records))
+            updates = [
+                (row_index[k], records[k]) for k in records if k in row_index
+            ]
+            appends = [(k, records[k]) for k in records if k not in row_index]
 
+            sheet_values = self.ws_helper.sheets.spreadsheets().values()
             written = 0
             if updates:
                 self.log_signal.emit(f"중앙 시트 업데이트: {len(updates)}건")
-                data = [
-                    {"range": f"{tab_title}!A{row_no}:E{row_no}", "values": [record]}
-                    for row_no, record in updates
-                ]
-                self.ws_helper.sheets.spreadsheets().values().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body={"valueInputOption": "RAW", "data": data},
-                ).execute()
-                written += len(updates)
+                for chunk in chunk_sheet_rows(updates, lambda u: u[1][1]):
+                    data = [
+                        {"range": f"{tab_title}!A{row_no}:E{row_no}", "values": [record]}
+                        for row_no, (_, record) in chunk
+                    ]
+                    api_executor("sheets").execute(
+                        sheet_values.batchUpdate(
+                            spreadsheetId=spreadsheet_id,
+                            body={"valueInputOption": "RAW", "data": data},
+                        ),
+                        log=self.log_signal.emit,
+                    )
+                    self._mark_uploaded(con, [uploaded for _, uploaded in chunk])
+                    written += len(chunk)
 
             if appends:
                 self.log_signal.emit(f"중앙 시트 추가: {len(appends)}건")
-                self.ws_helper.sheets.spreadsheets().values().append(
-                    spreadsheetId=spreadsheet_id,
-                    range=f"{tab_title}!A:E",
-                    valueInputOption="RAW",
-                    insertDataOption="INSERT_ROWS",
-                    body={"values": appends},
-                ).execute()
-                written += len(appends)
-
-            self.log_signal.emit("로컬 DB 상태 업데이트(dirty=0)...")
-            cur.executemany(
-                "UPDATE song_metadata SET dirty=0 WHERE file_path=?",
-                [(p,) for p in changed_abs_paths],
-            )
-            con.commit()
+                for chunk in chunk_sheet_rows(appends, lambda a: a[1][1]):
+                    resp = api_executor("sheets").execute(
+                        sheet_values.append(
+                            spreadsheetId=spreadsheet_id,
+                            range=f"{tab_title}!A:E",
+                            valueInputOption="RAW",
+                            insertDataOption="INSERT_ROWS",
+                            body={"values": [record for _, (_, record) in chunk]},
+                        ),
+                        log=self.log_signal.emit,
+                        idempotent=False,  # 다시 보내면 행이 두 번 추가됨
+                    )
+                    first_row = first_row_of_range(
+                        resp.get("updates", {}).get("updatedRange")
+                    )
+                    if first_row is None:
+                        # 추가된 위치를 모르면 다음 업로드 때 A열을 다시 읽음
+                        con.execute(
+                            "DELETE FROM sheet_row_index WHERE spreadsheet_id=?",
+                            (spreadsheet_id,),
+                        )
+                    else:
+                        con.executemany(
+                            "INSERT OR REPLACE INTO sheet_row_index"
+                            " (spreadsheet_id, path_key, row_no) VALUES (?, ?, ?)",
+                            [
+                                (spreadsheet_id, path_key, first_row + i)
+                                for i, (path_key, _) in enumerate(chunk)
+                            ],
+                        )
+                    self._mark_uploaded(con, [uploaded for _, uploaded in chunk])
+                    written += len(chunk)
+
             con.close()
 
             self.finished_signal.emit(
@@ -1109,6 +3040,8 @@ class MetadataUploadThread(QThread):
             except Exception:
                 pass
             self.finished_signal.emit(False, 0, f"중앙 업로드 오류: {str(e)}")
+        finally:
+            self.ws_helper.close()
 
 
 # --- [추가] 텍스트 슬라이드 입력 다이얼로그 ---
@@ -1413,6 +3346,8 @@ class PraiseSheetViewer(QMainWindow):
 
     # --- [__init__ 메서드 수정: 초기 크기 지정] ---
     def __init__(self):
+        self.startup_profiler = StartupProfiler()
+        self.startup_profiler.mark("모듈 import")
         super().__init__()
         self.setWindowTitle("물댄동산 악보 뷰어 Pet1 2:9 V5.0")
 
@@ -1438,7 +3373,8 @@ class PraiseSheetViewer(QMainWindow):
             self.app_dir = os.path.dirname(os.path.abspath(__file__))
 
         self.db_path = os.path.join(self.app_dir, "song_metadata.db")
-        self.init_database()
+        self.metadata_repo = MetadataRepository(self.db_path)
+        self.lyrics_fts_available = False
 
         # --- 아이콘 및 설정 로드 ---
         try:
@@ -1448,12 +3384,28 @@ class PraiseSheetViewer(QMainWindow):
         except Exception:
             pass
 
+        self.thumbnail_store = ThumbnailStore(os.path.join(self.app_dir, "thumbnails"))
+        # 쓰지 않는 썸네일 정리는 시작을 늦추지 않도록 백그라운드에서
+        threading.Thread(target=self.thumbnail_store.prune, daemon=True).start()
+
+        # 미리보기 패널: 백그라운드 디코딩 + 최근 결과 캐시 (화살표 키 탐색용)
+        self.preview_cache = ScaledPixmapCache(64 * 1024 * 1024)
+        self.preview_decoder = ImageDecoder(max_threads=1, parent=self)
+        self.preview_decoder.imageReady.connect(self._on_preview_decoded)
+        self._preview_key = None
+
         self.settings_file = os.path.join(self.app_dir, "settings.json")
         self.themes = self.get_themes()
         self.load_settings()
+        self.startup_profiler.mark("설정 로드")
+
+        # 상대경로 마이그레이션이 sheet_music_path를 쓰므로 설정 로드 이후에 실행
+        self.init_database()
+        self.startup_profiler.mark("DB 초기화/마이그레이션")
 
         # load_settings 이후에 메타데이터 캐시 로드 (sheet_music_path 필요)
-        self.metadata_cache = self.load_all_metadata_from_db()
+        self.metadata_cache = MetadataCache(self.load_all_metadata_from_db())
+        self.startup_profiler.mark("메타데이터 로드")
 
         self.favorites = set()
         self.favorites_file = os.path.join(self.app_dir, "favorites.json")
@@ -1468,8 +3420,14 @@ class PraiseSheetViewer(QMainWindow):
         self.model.setRootPath(self.sheet_music_path)
         self.model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot | QDir.Files)
 
+        self.sheet_catalog = FileCatalog(self.all_extensions)
+        self.sheet_catalog.attach(self.model)
         self.proxy_model = CustomSortFilterProxyModel(
-            self.all_extensions, self.favorites, self.metadata_cache, self
+            self.all_extensions,
+            self.favorites,
+            self.metadata_cache,
+            self,
+            catalog=self.sheet_catalog,
         )
         self.proxy_model.setSourceModel(self.model)
         self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
@@ -1478,13 +3436,20 @@ class PraiseSheetViewer(QMainWindow):
         self.playlist_model = QFileSystemModel()
         self.playlist_model.setRootPath(self.playlist_path)
         self.playlist_model.setFilter(QDir.AllDirs | QDir.NoDotAndDotDot | QDir.Files)
+        self.playlist_catalog = FileCatalog([".pls"])
+        self.playlist_catalog.attach(self.playlist_model)
         self.playlist_proxy_model = CustomSortFilterProxyModel(
-            [".pls"], set(), {}, self
+            [".pls"], set(), {}, self, catalog=self.playlist_catalog
         )
         self.playlist_proxy_model.setSourceModel(self.playlist_model)
+        self._catalog_threads = []  # 아직 끝나지 않은 색인 스레드 (종료 시 대기)
+        self._catalog_builders = {}  # id(catalog) -> 그 색인의 최신 스레드
+        self.rebuild_file_catalog(self.sheet_catalog, self.sheet_music_path)
+        self.rebuild_file_catalog(self.playlist_catalog, self.playlist_path)
         self.playlist_proxy_model.itemRenamed.connect(
             self.update_selection_after_rename
         )
+        self.startup_profiler.mark("모델 구성")
 
         # =========================================================
         # [UI 구성 시작]
@@ -2303,6 +4268,7 @@ class PraiseSheetViewer(QMainWindow):
 
         self.apply_theme(self.current_theme)
         self.warm_up_list_widget()
+        self.startup_profiler.mark("UI 구성")
 
     def decorate_as_card(self, widget):
         """위젯을 카드 형태로 꾸며줍니다 (ObjectName 설정 및 그림자 효과)."""
@@ -2339,20 +4305,11 @@ class PraiseSheetViewer(QMainWindow):
                     self.save_favorites()
 
                 # 3. 메타데이터 캐시 및 DB 제거
-                norm_path = os.path.normpath(file_path)
-                if norm_path in self.metadata_cache:
-                    del self.metadata_cache[norm_path]
+                # 키가 없는 곡도 가사 LRU에는 남아 있을 수 있으므로 pop으로 함께 지움
+                self.metadata_cache.pop(os.path.normpath(file_path), None)
 
                 try:
-                    rel_path = self._to_rel_path(file_path)
-                    con = sqlite3.connect(self.db_path)
-                    cur = con.cursor()
-                    cur.execute(
-                        "DELETE FROM song_metadata WHERE file_path = ?",
-                        (rel_path,),
-                    )
-                    con.commit()
-                    con.close()
+                    self.metadata_repo.delete(self._to_rel_path(file_path))
                 except Exception as e:
                     print(f"DB 데이터 삭제 실패: {e}")
 
@@ -2523,84 +4480,87 @@ class PraiseSheetViewer(QMainWindow):
         return os.path.normpath(os.path.join(self.sheet_music_path, p))
 
     def init_database(self):
+        """DB 스키마를 최신 버전으로 맞춥니다. (적용된 마이그레이션은 건너뜀)"""
         try:
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS song_metadata (
-                    file_path TEXT PRIMARY KEY,
-                    song_key TEXT,
-                    lyrics TEXT,
-                    updated_at TEXT,
-                    updated_by TEXT,
-                    dirty INTEGER DEFAULT 0
-                )
-            """
-            )
-            # 기존 DB에서 컬럼이 부족한 경우를 대비해 보강
-            cur.execute("PRAGMA table_info(song_metadata)")
-            cols = {row[1] for row in cur.fetchall()}
-            if "updated_at" not in cols:
-                cur.execute("ALTER TABLE song_metadata ADD COLUMN updated_at TEXT")
-            if "updated_by" not in cols:
-                cur.execute("ALTER TABLE song_metadata ADD COLUMN updated_by TEXT")
-            if "dirty" not in cols:
-                cur.execute(
-                    "ALTER TABLE song_metadata ADD COLUMN dirty INTEGER DEFAULT 0"
-                )
-            con.commit()
-
-            con.close()
+            con = self.metadata_repo.con
+            apply_schema_migrations(con, self.schema_migrations())
+            self.lyrics_fts_available = has_table(con, LYRICS_FTS_TABLE)
         except Exception as e:
             QMessageBox.critical(self, "DB 오류", f"데이터베이스 초기화 실패: {e}")
 
+    def schema_migrations(self):
+        """(버전, 이름, 함수) 목록. 새 스키마 변경은 끝에 다음 번호로 추가합니다."""
+        return [
+            (1, "song_metadata 테이블 및 동기화 컬럼", self._migrate_base_schema),
+            (2, "가사 FTS5 색인", ensure_lyrics_fts),
+            (3, "절대경로를 악보 폴더 기준 상대경로로 변환", self._migrate_db_to_relative_paths),
+            (4, "대소문자 무시 경로 키(path_key) 고유 색인", migrate_path_key),
+            (5, "가사 색인을 rowid 연결 방식으로 재구성", rebuild_lyrics_fts),
+            (6, "동기화 충돌 보관 테이블", migrate_metadata_conflicts),
+            (7, "중앙 시트 행 번호 캐시", migrate_sheet_row_index),
+            (8, "동기화 충돌 중복 제거 및 고유 색인", migrate_metadata_conflicts_unique),
+        ]
+
+    def _migrate_base_schema(self, con):
+        cur = con.cursor()
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS song_metadata (
+                file_path TEXT PRIMARY KEY,
+                song_key TEXT,
+                lyrics TEXT,
+                updated_at TEXT,
+                updated_by TEXT,
+                dirty INTEGER DEFAULT 0
+            )
+        """
+        )
+        # 기존 DB에서 컬럼이 부족한 경우를 대비해 보강
+        cur.execute("PRAGMA table_info(song_metadata)")
+        cols = {row[1] for row in cur.fetchall()}
+        if "updated_at" not in cols:
+            cur.execute("ALTER TABLE song_metadata ADD COLUMN updated_at TEXT")
+        if "updated_by" not in cols:
+            cur.execute("ALTER TABLE song_metadata ADD COLUMN updated_by TEXT")
+        if "dirty" not in cols:
+            cur.execute(
+                "ALTER TABLE song_metadata ADD COLUMN dirty INTEGER DEFAULT 0"
+            )
+
     def _migrate_db_to_relative_paths(self, con):
         """DB에 절대경로로 저장된 항목을 상대경로로 변환합니다."""
-        try:
-            cur = con.cursor()
-            cur.execute("SELECT file_path, song_key, lyrics, updated_at, updated_by, dirty FROM song_metadata")
-            rows = cur.fetchall()
-            base = os.path.normpath(self.sheet_music_path).lower()
-            migrated = 0
-            for fp, song_key, lyrics, updated_at, updated_by, dirty in rows:
-                norm = os.path.normpath(fp)
-                if os.path.isabs(norm) and norm.lower().startswith(base):
-                    rel = os.path.relpath(norm, os.path.normpath(self.sheet_music_path))
-                    if rel != fp:
-                        # 상대경로가 이미 존재하면 절대경로 항목만 삭제
+        cur = con.cursor()
+        cur.execute("SELECT file_path, song_key, lyrics, updated_at, updated_by, dirty FROM song_metadata")
+        rows = cur.fetchall()
+        base = os.path.normpath(self.sheet_music_path).lower()
+        migrated = 0
+        for fp, song_key, lyrics, updated_at, updated_by, dirty in rows:
+            norm = os.path.normpath(fp)
+            if os.path.isabs(norm) and norm.lower().startswith(base):
+                rel = os.path.relpath(norm, os.path.normpath(self.sheet_music_path))
+                if rel != fp:
+                    # 상대경로가 이미 존재하면 절대경로 항목만 삭제
+                    cur.execute(
+                        "SELECT 1 FROM song_metadata WHERE file_path = ?",
+                        (rel,),
+                    )
+                    if cur.fetchone():
                         cur.execute(
-                            "SELECT 1 FROM song_metadata WHERE file_path = ?",
-                            (rel,),
+                            "DELETE FROM song_metadata WHERE file_path = ?",
+                            (fp,),
                         )
-                        if cur.fetchone():
-                            cur.execute(
-                                "DELETE FROM song_metadata WHERE file_path = ?",
-                                (fp,),
-                            )
-                        else:
-                            cur.execute(
-                                "UPDATE song_metadata SET file_path = ? WHERE file_path = ?",
-                                (rel, fp),
-                            )
-                        migrated += 1
-            if migrated:
-                con.commit()
-                print(f"DB 마이그레이션: {migrated}개 경로를 상대경로로 변환")
-        except Exception as e:
-            print(f"DB 마이그레이션 오류 (무시됨): {e}")
-
-    def get_metadata_from_db(self, file_path):
-        try:
-            rel = self._to_rel_path(file_path).lower()
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            cur.execute(
-                "SELECT song_key, lyrics FROM song_metadata WHERE LOWER(file_path) = ?",
-                (rel,),
-            )
-            result = cur.fetchone()
-            con.close()
+                    else:
+                        cur.execute(
+                            "UPDATE song_metadata SET file_path = ? WHERE file_path = ?",
+                            (rel, fp),
+                        )
+                    migrated += 1
+        if migrated:
+            print(f"DB 마이그레이션: {migrated}개 경로를 상대경로로 변환")
+
+    def get_metadata_from_db(self, file_path):
+        try:
+            result = self.metadata_repo.get(self._to_rel_path(file_path))
             if result:
                 return result
             return (None, None)
@@ -2608,59 +4568,67 @@ class PraiseSheetViewer(QMainWindow):
             print(f"DB 읽기 오류: {e}")
             return (None, None)
 
+    def get_cached_metadata(self, file_path):
+        """(키, 가사)를 캐시에서 찾고, 가사가 LRU에 없을 때만 DB에서 읽습니다."""
+        norm_path = os.path.normpath(file_path)
+        lyrics = self.metadata_cache.cached_lyrics(norm_path)
+        if lyrics is not None:
+            return self.metadata_cache.get(norm_path) or "", lyrics
+        key, lyrics = self.get_metadata_from_db(file_path)
+        if key:
+            self.metadata_cache[norm_path] = key
+        self.metadata_cache.put_lyrics(norm_path, lyrics)
+        return key or "", lyrics or ""
+
     def set_metadata_in_db(self, file_path, song_key, lyrics):
         try:
-            rel = self._to_rel_path(file_path)
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             editor = getattr(self, "editor_name", "") or ""
-            cur.execute(
-                """
-                INSERT INTO song_metadata (file_path, song_key, lyrics, updated_at, updated_by, dirty)
-                VALUES (?, ?, ?, ?, ?, 1)
-                ON CONFLICT(file_path) DO UPDATE SET
-                    song_key=excluded.song_key,
-                    lyrics=excluded.lyrics,
-                    updated_at=excluded.updated_at,
-                    updated_by=excluded.updated_by,
-                    dirty=1
-            """,
-                (rel, song_key, lyrics, now, editor),
+            self.metadata_repo.upsert(
+                self._to_rel_path(file_path), song_key, lyrics, editor
             )
-            con.commit()
-            con.close()
-            self.metadata_cache[os.path.normpath(file_path)] = (song_key, lyrics)
-            self.proxy_model.invalidate()
+            norm_path = os.path.normpath(file_path)
+            self.metadata_cache[norm_path] = song_key or ""
+            self.metadata_cache.put_lyrics(norm_path, lyrics)
         except Exception as e:
             QMessageBox.critical(self, "DB 오류", f"데이터베이스 저장 실패: {e}")
 
+    def move_metadata_in_db(self, old_path, new_path):
+        """파일 이름이 바뀐 곡의 메타데이터 행을 새 경로로 옮기고 캐시를 맞춥니다."""
+        key, lyrics = self.get_metadata_from_db(old_path)
+        if not (key or lyrics):
+            return
+        try:
+            editor = getattr(self, "editor_name", "") or ""
+            self.metadata_repo.move(
+                self._to_rel_path(old_path), self._to_rel_path(new_path), editor
+            )
+            norm_path = os.path.normpath(new_path)
+            self.metadata_cache[norm_path] = key or ""
+            self.metadata_cache.put_lyrics(norm_path, lyrics)
+        except Exception as e:
+            print(f"DB 경로 이전 오류: {e}")
+
     def search_lyrics_from_db(self, search_text):
+        """가사 검색 결과 {경로: 순위}. 색인 검색이면 관련도(rank) 순입니다."""
         try:
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
             keywords = search_text.strip().split()
             if not keywords:
-                return set()
-            query = "SELECT file_path FROM song_metadata WHERE "
-            query += " AND ".join(["lyrics LIKE ?"] * len(keywords))
-            params = [f"%{keyword}%" for keyword in keywords]
-            cur.execute(query, params)
-            results = cur.fetchall()
-            con.close()
-            return {os.path.normpath(self._to_abs_path(row[0])) for row in results}
+                return {}
+            results = self.metadata_repo.search_lyrics(
+                keywords, self.lyrics_fts_available
+            )
+            ranks = {}
+            for rel in results:
+                ranks.setdefault(os.path.normpath(self._to_abs_path(rel)), len(ranks))
+            return ranks
         except Exception as e:
             QMessageBox.warning(self, "가사 검색 오류", f"가사 검색 중 오류 발생: {e}")
-            return set()
+            return {}
 
     def load_all_metadata_from_db(self):
         try:
-            con = sqlite3.connect(self.db_path)
-            cur = con.cursor()
-            cur.execute("SELECT file_path, song_key, lyrics FROM song_metadata")
-            results = cur.fetchall()
-            con.close()
-            return {os.path.normpath(self._to_abs_path(row[0])): (row[1], row[2]) for row in results}
+            results = self.metadata_repo.load_keys()
+            return {os.path.normpath(self._to_abs_path(row[0])): row[1] for row in results}
         except Exception as e:
             QMessageBox.critical(self, "DB 오류", f"전체 메타데이터 로드 실패: {e}")
             return {}
@@ -2688,13 +4656,7 @@ class PraiseSheetViewer(QMainWindow):
         self.inspector_lyrics_edit.setEnabled(True)
         self.btn_google_lyrics.setEnabled(True)
 
-        norm_path = os.path.normpath(path)
-        if norm_path in self.metadata_cache:
-            key, lyrics = self.metadata_cache[norm_path]
-        else:
-            key, lyrics = self.get_metadata_from_db(path)
-            if key or lyrics:
-                self.metadata_cache[norm_path] = (key, lyrics)
+        key, lyrics = self.get_cached_metadata(path)
 
         self.inspector_key_combo.blockSignals(True)
         self.inspector_lyrics_edit.blockSignals(True)
@@ -2705,13 +4667,13 @@ class PraiseSheetViewer(QMainWindow):
 
     def on_inspector_key_changed(self, new_key):
         if self.inspector_current_path:
-            _key, lyrics = self.get_metadata_from_db(self.inspector_current_path)
+            _key, lyrics = self.get_cached_metadata(self.inspector_current_path)
             if new_key != _key:
                 self.set_metadata_in_db(self.inspector_current_path, new_key, lyrics)
 
     def save_inspector_lyrics(self):
         if self.inspector_current_path:
-            key, old_lyrics = self.get_metadata_from_db(self.inspector_current_path)
+            key, old_lyrics = self.get_cached_metadata(self.inspector_current_path)
             new_lyrics = self.inspector_lyrics_edit.toPlainText()
             if new_lyrics != old_lyrics:
                 self.set_metadata_in_db(self.inspector_current_path, key, new_lyrics)
@@ -2749,6 +4711,16 @@ class PraiseSheetViewer(QMainWindow):
             if proxy_index.isValid():
                 tree.setCurrentIndex(proxy_index)
 
+    def show_thumbnail_tooltip(self, path, global_pos, widget):
+        """원본 대신 캐시된 썸네일 파일로 이미지 툴팁을 표시합니다."""
+        thumb = self.thumbnail_store.thumbnail_for(path)
+        if thumb is None:
+            QToolTip.hideText()
+            return
+        thumb_path, size = thumb
+        tooltip = f'<img style="margin:0;padding:0;" src="{thumb_path}" width="{size.width()}" height="{size.height()}"/>'
+        QToolTip.showText(global_pos + QPoint(20, 20), tooltip, widget)
+
     def playlist_tree_mouse_move_event(self, event):
         index = self.playlist_tree.indexAt(event.position().toPoint())
         if index.isValid() and index != self.current_tooltip_index:
@@ -2803,18 +4775,9 @@ class PraiseSheetViewer(QMainWindow):
                 and os.path.isfile(path)
                 and path.lower().endswith(tuple(self.image_extensions))
             ):
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    fixed_width = 250
-                    scaled = pixmap.scaledToWidth(fixed_width, Qt.SmoothTransformation)
-                    tooltip = f'<img style="margin:0;padding:0;" src="{path}" width="{scaled.width()}" height="{scaled.height()}"/>'
-                    QToolTip.showText(
-                        event.globalPosition().toPoint() + QPoint(20, 20),
-                        tooltip,
-                        self.preview_list_widget,
-                    )
-                else:
-                    QToolTip.hideText()
+                self.show_thumbnail_tooltip(
+                    path, event.globalPosition().toPoint(), self.preview_list_widget
+                )
             else:
                 QToolTip.hideText()
         elif item is None:
@@ -2833,18 +4796,9 @@ class PraiseSheetViewer(QMainWindow):
                 and os.path.isfile(path)
                 and path.lower().endswith(tuple(self.image_extensions))
             ):
-                pixmap = QPixmap(path)
-                if not pixmap.isNull():
-                    fixed_width = 250
-                    scaled = pixmap.scaledToWidth(fixed_width, Qt.SmoothTransformation)
-                    tooltip = f'<img style="margin:0;padding:0;" src="{path}" width="{scaled.width()}" height="{scaled.height()}"/>'
-                    QToolTip.showText(
-                        event.globalPosition().toPoint() + QPoint(20, 20),
-                        tooltip,
-                        self.list_widget,
-                    )
-                else:
-                    QToolTip.hideText()
+                self.show_thumbnail_tooltip(
+                    path, event.globalPosition().toPoint(), self.list_widget
+                )
             else:
                 QToolTip.hideText()
         elif item is None:
@@ -2927,10 +4881,11 @@ class PraiseSheetViewer(QMainWindow):
             index = model.index(row, 0, parent_index)
             if not self.tree.isRowHidden(row, parent_index):
                 source_index = self.proxy_model.mapToSource(index)
-                file_path = self.model.filePath(source_index)
-                if os.path.isfile(file_path):
+                entry = self.sheet_catalog.get(self.model.filePath(source_index))
+                is_dir = entry.is_dir if entry else self.model.isDir(source_index)
+                if not is_dir:
                     count += 1
-                if self.model.isDir(source_index):
+                else:
                     if self.tree.isExpanded(index):
                         count += self.count_visible_items(index)
         return count
@@ -3215,6 +5170,8 @@ class PraiseSheetViewer(QMainWindow):
         self.current_theme = "기본 (밝게)"
         self.initial_zoom_percentage = 60
         self.scroll_sensitivity = 30
+        # 쇼창 이미지 캐시 메모리 상한(MB)
+        self.viewer_cache_mb = 256
         self.logo_image_path = os.path.join(
             getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))),
             "Isa5811a.jpg"
@@ -3227,6 +5184,9 @@ class PraiseSheetViewer(QMainWindow):
         self.metadata_sheet_name = "song_metadata.csv"
         # 로컬 편집자 이름(업로드 시 기록)
         self.editor_name = os.environ.get("USERNAME") or os.environ.get("USER") or ""
+        # 가사DB 내려받기 방식(incremental/full)과 로컬 미업로드 수정과의 충돌 처리(lww/keep_both)
+        self.metadata_sync_mode = "incremental"
+        self.metadata_conflict_policy = "lww"
 
         try:
             if not os.path.exists(self.sheet_music_path):
@@ -3251,6 +5211,9 @@ class PraiseSheetViewer(QMainWindow):
                         "current_theme", self.current_theme
                     )
                     self.scroll_sensitivity = settings.get("scroll_sensitivity", 30)
+                    self.viewer_cache_mb = settings.get(
+                        "viewer_cache_mb", self.viewer_cache_mb
+                    )
                     saved_logo = settings.get("logo_image_path", "")
                     if saved_logo and os.path.isfile(saved_logo):
                         self.logo_image_path = saved_logo
@@ -3265,6 +5228,10 @@ class PraiseSheetViewer(QMainWindow):
                         "metadata_sheet_name", self.metadata_sheet_name
                     )
                     self.editor_name = settings.get("editor_name", self.editor_name)
+                    if settings.get("metadata_sync_mode") in METADATA_SYNC_MODES:
+                        self.metadata_sync_mode = settings["metadata_sync_mode"]
+                    if settings.get("metadata_conflict_policy") in METADATA_CONFLICT_POLICIES:
+                        self.metadata_conflict_policy = settings["metadata_conflict_policy"]
                     self.playlist_sheet_id = settings.get(
                         "playlist_sheet_id", self.playlist_sheet_id
                     )
@@ -3281,14 +5248,6 @@ class PraiseSheetViewer(QMainWindow):
             self.text_slide_font_size = 50
             self.save_settings()
 
-        # DB 절대경로 → 상대경로 마이그레이션 (load_settings 이후 실행)
-        try:
-            con = sqlite3.connect(self.db_path)
-            self._migrate_db_to_relative_paths(con)
-            con.close()
-        except Exception as e:
-            print(f"DB 마이그레이션 오류 (무시됨): {e}")
-
     def save_settings(self):
         settings = {
             "initial_zoom": self.initial_zoom_percentage,
@@ -3296,12 +5255,15 @@ class PraiseSheetViewer(QMainWindow):
             "playlist_path": self.playlist_path,
             "current_theme": self.current_theme,
             "scroll_sensitivity": self.scroll_sensitivity,
+            "viewer_cache_mb": self.viewer_cache_mb,
             "logo_image_path": self.logo_image_path,
             "drive_folder_id": self.drive_folder_id,
             "metadata_csv_name": self.metadata_csv_name,
             "metadata_sheet_name": self.metadata_sheet_name,
             "metadata_sheet_name": self.metadata_sheet_name,
             "editor_name": self.editor_name,
+            "metadata_sync_mode": self.metadata_sync_mode,
+            "metadata_conflict_policy": self.metadata_conflict_policy,
             "playlist_sheet_id": self.playlist_sheet_id,
             "text_slide_font_family": getattr(self, "text_slide_font_family", "맑은 고딕"),
             "text_slide_font_size": getattr(self, "text_slide_font_size", 50),
@@ -3314,12 +5276,51 @@ class PraiseSheetViewer(QMainWindow):
                 self, "설정 저장 오류", f"설정을 저장하는 중 오류 발생: {e}"
             )
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.startup_profiler is not None:
+            # 첫 그리기 시점에 한 번만 보고
+            self.startup_profiler.mark("창 표시 ~ 첫 그리기")
+            self.startup_profiler.report()
+            self.startup_profiler = None
+
     def closeEvent(self, event):
         self.save_settings()
         if self.viewer:
             self.viewer.close()
+        for thread in list(self._catalog_threads):
+            thread.requestInterruption()
+            thread.wait()
+        self.metadata_repo.close()
         super().closeEvent(event)
 
+    def rebuild_file_catalog(self, catalog, root):
+        """폴더 전체 색인을 백그라운드에서 다시 만듭니다.
+
+        같은 색인을 만들던 이전 스레드는 중단시키고, 그 결과가 늦게 도착해도 버립니다.
+        """
+        previous = self._catalog_builders.pop(id(catalog), None)
+        if previous is not None:
+            previous.requestInterruption()
+        catalog.clear()
+        if not root or not os.path.isdir(root):
+            return
+        thread = FileCatalogBuildThread(catalog, root)
+        thread.built.connect(
+            lambda entries, t=thread: self._on_file_catalog_built(t, entries)
+        )
+        thread.finished.connect(lambda t=thread: self._catalog_threads.remove(t))
+        self._catalog_threads.append(thread)
+        self._catalog_builders[id(catalog)] = thread
+        thread.start()
+
+    def _on_file_catalog_built(self, thread, entries):
+        # 폴더가 바뀐 뒤 도착한 이전 폴더의 스캔 결과는 버림
+        if self._catalog_builders.get(id(thread.catalog)) is not thread:
+            return
+        del self._catalog_builders[id(thread.catalog)]
+        thread.catalog.merge(entries)
+
     def change_sheet_music_folder(self):
         folder_path = QFileDialog.getExistingDirectory(
             self, "악보 폴더 선택", self.sheet_music_path
@@ -3328,6 +5329,7 @@ class PraiseSheetViewer(QMainWindow):
             self.sheet_music_path = folder_path
             self.path_label.setText(os.path.normpath(self.sheet_music_path))
             self.model.setRootPath(self.sheet_music_path)
+            self.rebuild_file_catalog(self.sheet_catalog, self.sheet_music_path)
             self.tree.setRootIndex(
                 self.proxy_model.mapFromSource(self.model.index(self.sheet_music_path))
             )
@@ -3341,6 +5343,7 @@ class PraiseSheetViewer(QMainWindow):
             self.playlist_path = folder_path
             self.playlist_path_label.setText(os.path.normpath(self.playlist_path))
             self.playlist_model.setRootPath(self.playlist_path)
+            self.rebuild_file_catalog(self.playlist_catalog, self.playlist_path)
             self.playlist_tree.setRootIndex(
                 self.playlist_proxy_model.mapFromSource(
                     self.playlist_model.index(self.playlist_path)
@@ -3489,14 +5492,7 @@ class PraiseSheetViewer(QMainWindow):
 
     def apply_search_filter(self, text):
         self.proxy_model.set_lyrics_filter(None)
-        keywords = text.strip().split()
-        if not keywords:
-            pattern = ""
-        else:
-            pattern = "".join([f"(?=.*{re.escape(keyword)})" for keyword in keywords])
-        self.proxy_model.setFilterRegularExpression(
-            QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-        )
+        self.proxy_model.set_name_keywords(text.strip().split())
         self.tree.setRootIndex(
             self.proxy_model.mapFromSource(self.model.index(self.model.rootPath()))
         )
@@ -3514,14 +5510,7 @@ class PraiseSheetViewer(QMainWindow):
         self.update_file_count(self.sheet_music_path)
 
     def apply_playlist_search_filter(self, text):
-        keywords = text.strip().split()
-        if not keywords:
-            pattern = ""
-        else:
-            pattern = "".join([f"(?=.*{re.escape(keyword)})" for keyword in keywords])
-        self.playlist_proxy_model.setFilterRegularExpression(
-            QRegularExpression(pattern, QRegularExpression.CaseInsensitiveOption)
-        )
+        self.playlist_proxy_model.set_name_keywords(text.strip().split())
         self.playlist_tree.setRootIndex(
             self.playlist_proxy_model.mapFromSource(
                 self.playlist_model.index(self.playlist_model.rootPath())
@@ -3582,20 +5571,9 @@ class PraiseSheetViewer(QMainWindow):
             path = source_model.filePath(source_index)
             if os.path.isfile(path):
                 if path.lower().endswith(tuple(self.image_extensions)):
-                    pixmap = QPixmap(path)
-                    if not pixmap.isNull():
-                        fixed_width = 250
-                        scaled = pixmap.scaledToWidth(
-                            fixed_width, Qt.SmoothTransformation
-                        )
-                        tooltip = f'<img style="margin:0;padding:0;" src="{path}" width="{scaled.width()}" height="{scaled.height()}"/>'
-                        QToolTip.showText(
-                            event.globalPosition().toPoint() + QPoint(20, 20),
-                            tooltip,
-                            tree,
-                        )
-                    else:
-                        QToolTip.hideText()
+                    self.show_thumbnail_tooltip(
+                        path, event.globalPosition().toPoint(), tree
+                    )
                 elif path.lower().endswith(".pls"):
                     try:
                         with open(path, "r", encoding="utf-8") as f:
@@ -4146,6 +6124,9 @@ class PraiseSheetViewer(QMainWindow):
             self.load_metadata_to_inspector(None)
 
     def update_preview_panel(self, path):
+        # 이전 선택의 디코딩 결과가 늦게 도착해도 화면을 덮어쓰지 않도록 해제
+        self._preview_key = None
+        self.preview_decoder.cancel()
         if not path:
             self.preview_label.setText("파일을 선택하여 미리보세요.")
             self.preview_label.setAlignment(Qt.AlignCenter)
@@ -4153,27 +6134,43 @@ class PraiseSheetViewer(QMainWindow):
             return
         if os.path.isfile(path) and path.lower().endswith(tuple(self.image_extensions)):
             self.preview_stack.setCurrentWidget(self.preview_scroll_area)
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
-                preview_width = self.preview_scroll_area.viewport().width()
-                if preview_width > 0:
-                    # 가로 너비를 꽉 채우고, 세로는 비율 유지 (가로 스크롤 없음, 세로 스크롤만 가능)
-                    scaled_pixmap = pixmap.scaledToWidth(
-                        preview_width, Qt.SmoothTransformation
-                    )
-                    self.preview_label.setPixmap(scaled_pixmap)
-                    self.preview_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
-                    self.preview_label.setMinimumWidth(preview_width)
-                    self.preview_label.setMaximumWidth(preview_width)
-                    self.preview_scroll_area.verticalScrollBar().setValue(0)
-                else:
-                    self.preview_label.setText("미리보기 영역이 너무 작습니다.")
-                    self.preview_label.setAlignment(Qt.AlignCenter)
-                    self.preview_label.setMinimumWidth(0)
-                    self.preview_label.setMaximumWidth(16777215)
+            preview_width = self.preview_scroll_area.viewport().width()
+            if preview_width <= 0:
+                self.preview_label.setText("미리보기 영역이 너무 작습니다.")
+                self.preview_label.setAlignment(Qt.AlignCenter)
+                self.preview_label.setMinimumWidth(0)
+                self.preview_label.setMaximumWidth(16777215)
+                return
+
+            # 가로 너비를 꽉 채우고, 세로는 비율 유지 (가로 스크롤 없음, 세로 스크롤만 가능)
+            # 키에 수정 시각/크기를 넣어 파일이 바뀌면(동기화로 다시 받은 경우 등) 새로 디코딩
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            key = (path, preview_width, 0, 1.0, "width", st.st_mtime_ns, st.st_size)
+            self._preview_key = key
+            pixmap = self.preview_cache.get(key)
+            if pixmap is not None:
+                self._set_preview_pixmap(pixmap, preview_width)
+                return
+
+            # 1) 캐시된 썸네일이 있으면 저화질로 먼저 표시
+            thumb = self.thumbnail_store.cached_thumbnail(path)
+            thumb_pixmap = QPixmap(thumb[0]) if thumb is not None else QPixmap()
+            if not thumb_pixmap.isNull():
+                self._set_preview_pixmap(
+                    thumb_pixmap.scaledToWidth(preview_width, Qt.FastTransformation),
+                    preview_width,
+                )
             else:
-                self.preview_label.setText("이미지를 불러올 수 없습니다.")
+                self.preview_label.setText("불러오는 중...")
                 self.preview_label.setAlignment(Qt.AlignCenter)
+
+            # 2) 원본 디코딩 + 가로 맞춤 스케일은 백그라운드에서
+            self.preview_decoder.request(
+                key, path, "width", 1.0, QSize(preview_width, 0), priority=1
+            )
         elif os.path.isfile(path) and path.lower().endswith(".pls"):
             self.preview_stack.setCurrentWidget(self.preview_list_widget)
             self.preview_list_widget.clear()
@@ -4232,6 +6229,26 @@ class PraiseSheetViewer(QMainWindow):
             )
             self.preview_label.setAlignment(Qt.AlignCenter)
 
+    def _set_preview_pixmap(self, pixmap, preview_width, reset_scroll=True):
+        self.preview_label.setPixmap(pixmap)
+        self.preview_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
+        self.preview_label.setMinimumWidth(preview_width)
+        self.preview_label.setMaximumWidth(preview_width)
+        if reset_scroll:
+            self.preview_scroll_area.verticalScrollBar().setValue(0)
+
+    def _on_preview_decoded(self, key, image, _pyramid):
+        if key != self._preview_key:
+            return  # 이미 다른 항목으로 이동함
+        if image.isNull():
+            self.preview_label.setText("이미지를 불러올 수 없습니다.")
+            self.preview_label.setAlignment(Qt.AlignCenter)
+            return
+        pixmap = QPixmap.fromImage(image)
+        self.preview_cache.put(key, pixmap)
+        # 썸네일 -> 원본 교체 시에는 사용자가 내린 스크롤 위치 유지
+        self._set_preview_pixmap(pixmap, key[1], reset_scroll=False)
+
     def run_google_sync(self):
         # 1. 사전 체크
         key_file = os.path.join(self.app_dir, "service_account.json")
@@ -4310,7 +6327,12 @@ class PraiseSheetViewer(QMainWindow):
             key_file, self.sheet_music_path, self.drive_folder_id, self.app_dir
         )
         self.sync_thread = MetadataSyncThread(
-            syncer_helper, self.metadata_csv_name, self.db_path, self.sheet_music_path
+            syncer_helper,
+            self.metadata_csv_name,
+            self.db_path,
+            self.sheet_music_path,
+            sync_mode=self.metadata_sync_mode,
+            conflict_policy=self.metadata_conflict_policy,
         )
 
         # 4. 시그널 연결
@@ -4378,11 +6400,50 @@ class PraiseSheetViewer(QMainWindow):
         if success:
             self.sync_dialog.append_log(f"-> {updated_rows}건 반영")
             # 검색/키 필터에 바로 반영
-            self.metadata_cache = self.load_all_metadata_from_db()
-            self.proxy_model.metadata_cache = self.metadata_cache
+            self.metadata_cache.replace_all(self.load_all_metadata_from_db())
             self.proxy_model.invalidate()
             self.load_metadata_to_inspector(self.current_preview_path)
         self.status_bar_label.setText(msg)
+        if success:
+            self.review_metadata_conflicts()
+
+    def review_metadata_conflicts(self):
+        """keep_both로 보관된 중앙 버전을 보여주고, 원하면 로컬 수정 대신 적용합니다.
+
+        로컬 유지를 고르면 다음 업로드 때 로컬 수정이 올라가면서 기록이 지워집니다.
+        """
+        try:
+            conflicts = self.metadata_repo.load_conflicts()
+        except sqlite3.Error as e:
+            print(f"충돌 기록 읽기 오류: {e}")
+            return
+        if not conflicts:
+            return
+        lines = []
+        for _path_key, file_path, song_key, _lyrics, updated_at, updated_by in conflicts[:10]:
+            lines.append(f"- {file_path} (중앙: 키 {song_key or '없음'}, {updated_at} {updated_by})")
+        if len(conflicts) > 10:
+            lines.append(f"... 외 {len(conflicts) - 10}건")
+        reply = QMessageBox.question(
+            self,
+            "동기화 충돌",
+            f"올리지 않은 로컬 수정과 다른 중앙 버전이 {len(conflicts)}건 있습니다.\n\n"
+            + "\n".join(lines)
+            + "\n\n중앙 버전으로 덮어쓸까요? (아니요: 로컬 수정 유지, 다음 업로드 때 반영)",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+        try:
+            self.metadata_repo.accept_conflicts(conflicts)
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "DB 오류", f"중앙 버전 적용 실패: {e}")
+            return
+        self.metadata_cache.replace_all(self.load_all_metadata_from_db())
+        self.proxy_model.invalidate()
+        self.load_metadata_to_inspector(self.current_preview_path)
+        self.status_bar_label.setText(f"중앙 버전 {len(conflicts)}건 적용")
 
     def on_sync_finished(self, success, download_count, msg):  # 인자 구조 변경
         self.sync_dialog.finish_sync(success, msg)
@@ -4464,7 +6525,8 @@ class PraiseSheetViewer(QMainWindow):
 
         self.playlist_sync_thread = PlaylistSyncThread(
             key_file, self.playlist_sheet_id,
-            self.playlist_path, mode="upload"
+            self.playlist_path, mode="upload",
+            manifest_path=os.path.join(self.app_dir, PlaylistSyncThread.MANIFEST_NAME),
         )
         self.playlist_sync_thread.log_signal.connect(self.sync_dialog.append_log)
         self.playlist_sync_thread.progress_signal.connect(self.sync_dialog.update_progress)
@@ -4483,7 +6545,8 @@ class PraiseSheetViewer(QMainWindow):
 
         self.playlist_sync_thread = PlaylistSyncThread(
             key_file, self.playlist_sheet_id,
-            self.playlist_path, mode="download"
+            self.playlist_path, mode="download",
+            manifest_path=os.path.join(self.app_dir, PlaylistSyncThread.MANIFEST_NAME),
         )
         self.playlist_sync_thread.log_signal.connect(self.sync_dialog.append_log)
         self.playlist_sync_thread.progress_signal.connect(self.sync_dialog.update_progress)
@@ -4523,6 +6586,7 @@ class PraiseSheetViewer(QMainWindow):
             start_index=start_index,
             scroll_sensitivity=self.scroll_sensitivity,
             logo_path=self.logo_image_path,
+            cache_budget_mb=self.viewer_cache_mb,
         )
 
         self.viewer.closed.connect(self.on_viewer_closed)
@@ -4609,10 +6673,222 @@ class PraiseSheetViewer(QMainWindow):
         self.open_viewer_window(data, start_index)
 
 
+# --- [쇼창 이미지 캐시] ---
+class ScaledPixmapCache:
+    """디코딩과 스케일이 끝난 QPixmap을 바이트 예산 안에서 LRU로 보관합니다.
+
+    키는 (경로, 뷰포트 가로, 뷰포트 세로, 줌, 표시 모드) 튜플입니다.
+    세션 내내 쓰는 미리보기 캐시는 끝에 파일 수정 시각(ns)과 크기를 덧붙입니다.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._items = OrderedDict()
+        self._used_bytes = 0
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        if pixmap is None or pixmap.isNull():
+            return
+        size = self._pixmap_bytes(pixmap)
+        if size > self.budget_bytes:
+            # 예산보다 큰 이미지는 캐시하지 않음 (다른 항목만 밀어내게 됨)
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self._used_bytes -= self._pixmap_bytes(old)
+        self._items[key] = pixmap
+        self._used_bytes += size
+        while self._used_bytes > self.budget_bytes and self._items:
+            _key, evicted = self._items.popitem(last=False)
+            self._used_bytes -= self._pixmap_bytes(evicted)
+
+    def clear(self):
+        self._items.clear()
+        self._used_bytes = 0
+
+
+# --- [백그라운드 이미지 디코딩] ---
+def scale_image_for_mode(
+    image: QImage, mode: str, zoom: float, view_size, transform=Qt.SmoothTransformation
+) -> QImage:
+    """QImage를 쇼창 표시 모드(width/cover/fit/height)에 맞게 스케일합니다."""
+    if mode == "cover":
+        scaled = image.scaled(view_size, Qt.KeepAspectRatioByExpanding, transform)
+        # 중앙 기준으로 crop
+        x = (scaled.width() - view_size.width()) // 2
+        y = (scaled.height() - view_size.height()) // 2
+        return scaled.copy(x, y, view_size.width(), view_size.height())
+    if mode == "fit":
+        return image.scaled(view_size, Qt.KeepAspectRatio, transform)
+    if mode == "height":
+        return image.scaledToHeight(view_size.height(), transform)
+    return image.scaledToWidth(int(view_size.width() * zoom), transform)
+
+
+class ZoomPyramid:
+    """현재 슬라이드의 디코딩 원본과 1/2, 1/4 ... 축소본(밉맵).
+
+    줌 단계마다 파일을 다시 열지 않고, 목표 크기보다 크면서 가장 작은
+    레벨에서 스케일하여 Ctrl+휠 연속 줌도 화면 갱신 속도를 유지합니다.
+    """
+
+    MAX_DOWNSAMPLES = 3
+    MIN_LEVEL_WIDTH = 512
+
+    def __init__(self, original: QImage):
+        self.levels = [original]
+        level = original
+        for _ in range(self.MAX_DOWNSAMPLES):
+            if level.width() // 2 < self.MIN_LEVEL_WIDTH:
+                break
+            level = level.scaled(
+                level.width() // 2,
+                level.height() // 2,
+                Qt.IgnoreAspectRatio,
+                Qt.SmoothTransformation,
+            )
+            self.levels.append(level)
+
+    def source_for(self, mode, zoom, view_size) -> QImage:
+        base = self.levels[0]
+        width, height = base.width(), base.height()
+        if width <= 0 or height <= 0:
+            return base
+        fx = view_size.width() / width
+        fy = view_size.height() / height
+        if mode == "width":
+            factor = fx * zoom
+        elif mode == "height":
+            factor = fy
+        elif mode == "fit":
+            factor = min(fx, fy)
+        else:
+            factor = max(fx, fy)
+
+        chosen = base
+        for level in self.levels[1:]:
+            if level.width() < width * factor or level.height() < height * factor:
+                break
+            chosen = level
+        return chosen
+
+    def render(self, mode, zoom, view_size, transform=Qt.SmoothTransformation) -> QImage:
+        source = self.source_for(mode, zoom, view_size)
+        return scale_image_for_mode(source, mode, zoom, view_size, transform)
+
+
+class _DecodeSignals(QObject):
+    # QRunnable은 시그널을 가질 수 없어 별도 QObject로 전달
+    decoded = Signal(object, object, QImage, object)  # key, ticket, image, pyramid
+
+
+class _DecodeTicket:
+    """취소 플래그. 워커는 디코딩 전/후에 확인하고 취소되었으면 결과를 버립니다."""
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+
+class ImageDecodeTask(QRunnable):
+    """mode가 "pyramid"이면 스케일 없이 ZoomPyramid만 만들어 돌려줍니다."""
+
+    def __init__(self, signals, ticket, key, path, mode, zoom, view_size, with_pyramid):
+        super().__init__()
+        self.signals = signals
+        self.ticket = ticket
+        self.key = key
+        self.path = path
+        self.mode = mode
+        self.zoom = zoom
+        self.view_size = view_size
+        self.with_pyramid = with_pyramid or mode == "pyramid"
+
+    def run(self):
+        if self.ticket.cancelled:
+            return
+        image = QImageReader(self.path).read()
+        if self.ticket.cancelled:
+            return
+        pyramid = None
+        if not image.isNull():
+            if self.with_pyramid:
+                pyramid = ZoomPyramid(image)
+            if self.mode == "pyramid":
+                image = QImage()
+            elif pyramid is not None:
+                image = pyramid.render(self.mode, self.zoom, self.view_size)
+            else:
+                image = scale_image_for_mode(image, self.mode, self.zoom, self.view_size)
+        self.signals.decoded.emit(self.key, self.ticket, image, pyramid)
+
+
+class ImageDecoder(QObject):
+    """QThreadPool에서 이미지를 디코딩/스케일하고 결과를 GUI 스레드로 돌려줍니다.
+
+    QPixmap은 GUI 스레드 전용이므로 워커는 QImage만 다루고,
+    QPixmap 변환은 imageReady를 받은 쪽에서 합니다.
+    """
+
+    imageReady = Signal(object, QImage, object)  # key, image (실패 시 null), pyramid
+
+    def __init__(self, max_threads=2, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._signals = _DecodeSignals()
+        self._signals.decoded.connect(self._on_decoded)
+        self._pending = {}  # key -> _DecodeTicket
+
+    def request(self, key, path, mode, zoom, view_size, priority=0, with_pyramid=False):
+        if key in self._pending:
+            return
+        ticket = _DecodeTicket()
+        self._pending[key] = ticket
+        task = ImageDecodeTask(
+            self._signals, ticket, key, path, mode, zoom, view_size, with_pyramid
+        )
+        self.pool.start(task, priority)
+
+    def cancel(self, keep=()):
+        """keep에 없는 대기/진행 중 요청을 모두 취소합니다."""
+        for key in list(self._pending):
+            if key not in keep:
+                self._pending.pop(key).cancelled = True
+
+    def _on_decoded(self, key, ticket, image, pyramid):
+        if self._pending.get(key) is not ticket:
+            return  # 취소되었거나 같은 키로 다시 요청된 이전 작업
+        del self._pending[key]
+        self.imageReady.emit(key, image, pyramid)
+
+
 class FullScreenViewer(QWidget):
     # 창이 닫힐 때 메인 윈도우에 알리기 위한 시그널
     closed = Signal()
 
+    # 현재 슬라이드를 보여주는 동안 미리 준비할 이웃 슬라이드 (다음곡 우선)
+    PREFETCH_OFFSETS = (1, -1)
+    # 리사이즈/줌 렌더링 병합 간격 (미리보기 프레임, 고화질 전환 대기)
+    RENDER_FRAME_MS = 16
+    RENDER_SETTLE_MS = 150
+    # 페이드 전환 중 새 슬라이드 디코딩을 기다리는 최대 시간 (넘으면 빈 화면으로 밝아짐)
+    FADE_IN_MAX_WAIT_MS = 1000
+
     def __init__(
         self,
         playlist_data,
@@ -4620,6 +6896,7 @@ class FullScreenViewer(QWidget):
         start_index=0,
         scroll_sensitivity=30,
         logo_path="",
+        cache_budget_mb=256,
     ):
         super().__init__()
         self.playlist_data = playlist_data
@@ -4633,6 +6910,30 @@ class FullScreenViewer(QWidget):
         self.show_ended = False
         self.logo_path = logo_path
 
+        # --- 디코딩/스케일 결과 캐시 + 백그라운드 디코더 ---
+        # 디코딩은 워커 스레드에서 하고, 화면에 띄울 키(_display_key)와 일치하는
+        # 결과만 image_label에 반영합니다. 나머지는 캐시에만 들어갑니다.
+        self.pixmap_cache = ScaledPixmapCache(cache_budget_mb * 1024 * 1024)
+        self._display_key = None
+        # 현재 슬라이드 원본의 줌 피라미드 (줌 단계마다 파일 재디코딩 방지)
+        self._pyramid = None
+        self._pyramid_path = None
+        self.decoder = ImageDecoder(parent=self)
+        self.decoder.imageReady.connect(self._on_image_decoded)
+
+        # --- 리사이즈/줌 연속 입력 병합 렌더링 ---
+        # 프레임당 최대 1회 FastTransformation 미리보기를 그리고,
+        # 입력이 잠잠해지면 SmoothTransformation으로 한 번만 다시 그립니다.
+        self._render_reset_zoom = False
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.RENDER_FRAME_MS)
+        self._preview_timer.timeout.connect(self._render_preview)
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(self.RENDER_SETTLE_MS)
+        self._settle_timer.timeout.connect(self._render_settled)
+
         self.setWindowTitle("악보 쇼 (쇼화면)")
         self.setFocusPolicy(Qt.StrongFocus)
         
@@ -4724,6 +7025,13 @@ class FullScreenViewer(QWidget):
         self.fade_anim.setEasingCurve(QEasingCurve.InOutQuad)
         self.fade_anim.setDuration(300)
 
+        # 새 슬라이드가 디코딩 중이면 도착한 뒤에 밝아지도록 미뤄 둔 페이드 인
+        self._pending_fade_in = None
+        self._fade_in_timer = QTimer(self)
+        self._fade_in_timer.setSingleShot(True)
+        self._fade_in_timer.setInterval(self.FADE_IN_MAX_WAIT_MS)
+        self._fade_in_timer.timeout.connect(self._release_fade_in)
+
         self.scroll_area.viewport().installEventFilter(self)
 
         self.next_song_label = QLabel(self)
@@ -4749,68 +7057,16 @@ class FullScreenViewer(QWidget):
         self.scroll_area.horizontalScrollBar().setValue(0)
 
     def closeEvent(self, event):
+        self._preview_timer.stop()
+        self._settle_timer.stop()
+        self._display_key = None
+        self._pyramid = None
+        self._pyramid_path = None
+        self.decoder.cancel()
+        self.pixmap_cache.clear()
         self.closed.emit()
         super().closeEvent(event)
 
-    def load_image(self):
-        if not self.playlist_data:
-            self.image_label.clear()
-            return
-
-        self.zoom = self.initial_zoom
-        current_data = self.playlist_data[self.current_index]
-        path = current_data["path"]
-        is_intermission = current_data["is_intermission"]
-
-        # --- [배경색 동적 변경 추가] ---
-        bg_color = "black" if is_intermission else "white"
-        self.scroll_area.setStyleSheet(f"background-color: {bg_color}; border: none;")
-        self.image_label.setStyleSheet(f"background-color: {bg_color};")
-        # -----------------------------
-
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            self.image_label.setText("이미지를 불러올 수 없습니다.")
-            return
-
-        view_size = self.scroll_area.viewport().size()
-
-        if is_intermission:
-            # 화면을 가득 채우되, 비율 유지 + 넘치는 부분 crop
-            scaled = pixmap.scaled(
-                view_size,
-                Qt.KeepAspectRatioByExpanding,
-                Qt.SmoothTransformation,
-            )
-
-            # 중앙 기준으로 crop
-            x = (scaled.width() - view_size.width()) // 2
-            y = (scaled.height() - view_size.height()) // 2
-            cropped = scaled.copy(
-                x,
-                y,
-                view_size.width(),
-                view_size.height(),
-            )
-
-            self.image_label.setPixmap(cropped)
-            self.image_label.setAlignment(Qt.AlignCenter)
-
-            # 인터미션은 스크롤 없이
-            self.scroll_area.verticalScrollBar().setValue(0)
-            self.scroll_area.horizontalScrollBar().setValue(0)
-            self.next_song_label.hide()
-        else:
-            # --- 일반 악보 모드: 가로 폭 기준 스크롤 ---
-            self.image_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
-            viewer_width = view_size.width()
-            scaled = pixmap.scaledToWidth(
-                int(viewer_width * self.zoom), Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
-            self.image_label.setPixmap(scaled)
-            self.update_next_song_label()
-
     def get_theme_style(self, theme_name):
         if not theme_name: theme_name = "기본"
         if "새벽" in theme_name:
@@ -4921,7 +7177,9 @@ class FullScreenViewer(QWidget):
             # Label 자체를 ScrollArea 가운데 정렬
             self.scroll_area.setAlignment(Qt.AlignCenter)
             
+            self._display_key = None
             self.update_next_song_label()
+            self._request_slide_images(None)
             return
 
         # --- [IMAGE TYPE 처리 (기존 로직)] ---
@@ -4934,47 +7192,10 @@ class FullScreenViewer(QWidget):
         self.image_label.setStyleSheet(f"background-color: {bg_color};")
         # -----------------------------
 
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            self.image_label.setText("이미지를 불러올 수 없습니다.")
-            return
-
-        view_size = self.scroll_area.viewport().size()
-
-        if is_intermission:
-            # 화면을 가득 채우되, 비율 유지 + 넘치는 부분 crop
-            scaled = pixmap.scaled(
-                view_size,
-                Qt.KeepAspectRatioByExpanding,
-                Qt.SmoothTransformation,
-            )
-
-            # 중앙 기준으로 crop
-            x = (scaled.width() - view_size.width()) // 2
-            y = (scaled.height() - view_size.height()) // 2
-            cropped = scaled.copy(
-                x,
-                y,
-                view_size.width(),
-                view_size.height(),
-            )
-
-            self.image_label.setPixmap(cropped)
-            self.image_label.setAlignment(Qt.AlignCenter)
-
-            # 인터미션은 스크롤 없이
-            self.scroll_area.verticalScrollBar().setValue(0)
-            self.scroll_area.horizontalScrollBar().setValue(0)
-            self.next_song_label.hide()
-        else:
-            # --- 일반 악보 모드: 가로 폭 기준 스크롤 ---
-            self.image_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
-            viewer_width = view_size.width()
-            scaled = pixmap.scaledToWidth(
-                int(viewer_width * self.zoom), Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
-            self.update_next_song_label()
+        # 인터미션: 화면을 가득 채우되 비율 유지 + 넘치는 부분 crop
+        # 일반 악보: 가로 폭 기준 스크롤
+        mode = "cover" if is_intermission else "width"
+        self._show_slide_image(path, mode, self.zoom)
 
     def load_image_with_current_zoom(self):
         if not self.playlist_data:
@@ -5045,6 +7266,7 @@ class FullScreenViewer(QWidget):
             
             self.scroll_area.setAlignment(Qt.AlignCenter)
             
+            self._display_key = None
             self.update_next_song_label()
             return
 
@@ -5057,29 +7279,154 @@ class FullScreenViewer(QWidget):
         self.image_label.setStyleSheet(f"background-color: {bg_color};")
         # -----------------------------
 
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            return
+        if is_intermission:
+            # 인터미션은 줌 영향 안 받음 (항상 핏)
+            self._show_slide_image(path, "fit", 1.0)
+        else:
+            self._show_slide_image(path, "width", self.zoom)
 
+    def _render_key(self, path, mode, zoom):
         view_size = self.scroll_area.viewport().size()
+        return (path, view_size.width(), view_size.height(), round(zoom, 3), mode)
 
-        if is_intermission:
-            # 인터미션은 줌 영향 안 받음 (항상 핏)
-            scaled = pixmap.scaled(
-                view_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
+    def _show_slide_image(self, path, mode, zoom):
+        """캐시에 있으면 즉시 표시하고, 없으면 백그라운드 디코딩을 요청합니다.
+
+        디코딩이 끝날 때까지는 이전 화면을 그대로 유지합니다.
+        """
+        if self._pyramid_path != path:
+            self._pyramid = None
+            self._pyramid_path = None
+
+        key = self._render_key(path, mode, zoom)
+        self._display_key = key
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is None and self._pyramid is not None:
+            # 줌/모드 변경: 원본 재디코딩 없이 피라미드의 가까운 레벨에서 스케일
+            image = self._pyramid.render(mode, zoom, self.scroll_area.viewport().size())
+            pixmap = QPixmap.fromImage(image)
+            self.pixmap_cache.put(key, pixmap)
+        if pixmap is not None:
+            self._apply_slide_pixmap(pixmap, mode)
+        self._request_slide_images(key if pixmap is None else None)
+
+    def _apply_slide_pixmap(self, pixmap, mode):
+        self.image_label.setPixmap(pixmap)
+        # 페이드 전환이 이 그림을 기다리고 있었다면 이제 밝아짐
+        self._release_fade_in()
+        if mode in ("cover", "fit"):
             self.image_label.setAlignment(Qt.AlignCenter)
+            if mode == "cover":
+                # 인터미션은 스크롤 없이
+                self.scroll_area.verticalScrollBar().setValue(0)
+                self.scroll_area.horizontalScrollBar().setValue(0)
             self.next_song_label.hide()
         else:
-            viewer_width = view_size.width()
-            scaled = pixmap.scaledToWidth(
-                int(viewer_width * self.zoom), Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled)
             self.image_label.setAlignment(Qt.AlignTop | Qt.AlignHCenter)
+            if mode == "height":
+                self.scroll_area.verticalScrollBar().setValue(0)
+                self.scroll_area.horizontalScrollBar().setValue(0)
             self.update_next_song_label()
 
+    def _request_slide_images(self, current_key):
+        """현재 슬라이드(우선) + 이웃 슬라이드 디코딩을 요청하고, 나머지 대기 작업은 취소합니다."""
+        view_size = self.scroll_area.viewport().size()
+        wanted = []
+        if current_key is not None:
+            # 현재 슬라이드는 디코딩하는 김에 줌 피라미드도 함께 생성
+            wanted.append((current_key, 2))
+        elif self._display_key is not None and self._pyramid is None:
+            # 캐시 적중으로 바로 표시된 경우, 첫 줌 전에 피라미드만 미리 준비
+            path = self._display_key[0]
+            wanted.append(((path, 0, 0, 0.0, "pyramid"), 1))
+        for offset in self.PREFETCH_OFFSETS:
+            index = self.current_index + offset
+            if not (0 <= index < len(self.playlist_data)):
+                continue
+            data = self.playlist_data[index]
+            if data.get("type", "image") == "text":
+                continue
+            # 슬라이드 이동 시 줌은 initial_zoom으로 초기화되므로 그 기준으로 준비
+            mode = "cover" if data["is_intermission"] else "width"
+            key = self._render_key(data["path"], mode, self.initial_zoom)
+            if key not in self.pixmap_cache:
+                wanted.append((key, 0))
+
+        self.decoder.cancel(keep={key for key, _priority in wanted})
+        for key, priority in wanted:
+            path, _w, _h, zoom, mode = key
+            self.decoder.request(
+                key, path, mode, zoom, view_size, priority, with_pyramid=priority > 0
+            )
+
+    def _on_image_decoded(self, key, image, pyramid):
+        path, mode = key[0], key[4]
+        if (
+            pyramid is not None
+            and self._display_key is not None
+            and self._display_key[0] == path
+        ):
+            self._pyramid = pyramid
+            self._pyramid_path = path
+        if mode == "pyramid":
+            return
+        if image.isNull():
+            if key == self._display_key:
+                self.image_label.setText("이미지를 불러올 수 없습니다.")
+                self._release_fade_in()
+            return
+        pixmap = QPixmap.fromImage(image)
+        self.pixmap_cache.put(key, pixmap)
+        # 그 사이 다른 슬라이드로 넘어갔다면 캐시에만 남기고 화면은 건드리지 않음
+        if key == self._display_key:
+            self._apply_slide_pixmap(pixmap, key[4])
+
+    def _schedule_render(self, reset_zoom=False):
+        """리사이즈/줌 요청을 병합합니다. reset_zoom이면 load_image(), 아니면 현재 줌으로 렌더."""
+        if reset_zoom:
+            self.zoom = self.initial_zoom
+        self._render_reset_zoom = reset_zoom
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
+        self._settle_timer.start()
+
+    def _render_preview(self):
+        """입력이 이어지는 동안 보여줄 저화질(FastTransformation) 미리보기."""
+        if not self.playlist_data or self.main_layout.currentWidget() != self.scroll_area:
+            return
+        current_data = self.playlist_data[self.current_index]
+        if current_data.get("type", "image") == "text":
+            self.load_image_with_current_zoom()
+            return
+
+        path = current_data["path"]
+        if current_data["is_intermission"]:
+            mode = "cover" if self._render_reset_zoom else "fit"
+        else:
+            mode = "width"
+        key = self._render_key(path, mode, self.zoom)
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is None:
+            if self._pyramid is None or self._pyramid_path != path:
+                return
+            image = self._pyramid.render(
+                mode, self.zoom, self.scroll_area.viewport().size(), Qt.FastTransformation
+            )
+            # 미리보기는 캐시하지 않음 (곧 고화질로 교체됨)
+            pixmap = QPixmap.fromImage(image)
+        self._apply_slide_pixmap(pixmap, mode)
+
+    def _render_settled(self):
+        self._preview_timer.stop()
+        reset_zoom = self._render_reset_zoom
+        self._render_reset_zoom = False
+        if self.main_layout.currentWidget() != self.scroll_area:
+            return
+        if reset_zoom:
+            self.load_image()
+        else:
+            self.load_image_with_current_zoom()
+
     def _run_brightness_transition(self, after_fade_in_callback):
         """화면을 잠깐 어둡게(밝기 변화) 했다가 복귀시키는 전환."""
         if self._is_transitioning:
@@ -5105,22 +7452,41 @@ class FullScreenViewer(QWidget):
                     # 다시 밝아지기
                     self.fade_anim.finished.disconnect(_on_faded_to_black)
                     self.fade_anim.stop()
-                    self.fade_anim.setStartValue(1.0)
-                    self.fade_anim.setEndValue(0.0)
+                    if (
+                        self._display_key is not None
+                        and self._display_key not in self.pixmap_cache
+                    ):
+                        # 새 슬라이드 디코딩 대기 중: 이전 그림을 지우고 도착하면 밝아짐
+                        self.image_label.clear()
+                        self._pending_fade_in = _fade_back_in
+                        self._fade_in_timer.start()
+                    else:
+                        _fade_back_in()
 
-                    def _on_fade_back_done():
-                        self.fade_anim.finished.disconnect(_on_fade_back_done)
-                        self.fade_overlay.hide()
-                        self._is_transitioning = False
+            def _fade_back_in():
+                self.fade_anim.setStartValue(1.0)
+                self.fade_anim.setEndValue(0.0)
 
-                    self.fade_anim.finished.connect(_on_fade_back_done)
-                    self.fade_anim.start()
+                def _on_fade_back_done():
+                    self.fade_anim.finished.disconnect(_on_fade_back_done)
+                    self.fade_overlay.hide()
+                    self._is_transitioning = False
+
+                self.fade_anim.finished.connect(_on_fade_back_done)
+                self.fade_anim.start()
 
             self.fade_anim.finished.connect(_on_faded_to_black)
             self.fade_anim.start()
 
         _fade_out_to_black()
 
+    def _release_fade_in(self):
+        """미뤄 둔 페이드 인을 시작합니다. (디코딩 도착 또는 대기 시간 초과)"""
+        self._fade_in_timer.stop()
+        fade_in, self._pending_fade_in = self._pending_fade_in, None
+        if fade_in is not None:
+            fade_in()
+
     def _navigate_to(self, new_index: int):
         if not (0 <= new_index < len(self.playlist_data)):
             return
@@ -5151,16 +7517,7 @@ class FullScreenViewer(QWidget):
             self.load_image_with_current_zoom()
             return
 
-        path = current_data["path"]
-        pixmap = QPixmap(path)
-        if pixmap.isNull():
-            return
-        viewer_height = self.scroll_area.viewport().height()
-        scaled = pixmap.scaledToHeight(viewer_height, Qt.SmoothTransformation)
-        self.image_label.setPixmap(scaled)
-        self.scroll_area.verticalScrollBar().setValue(0)
-        self.scroll_area.horizontalScrollBar().setValue(0)
-        self.update_next_song_label()
+        self._show_slide_image(current_data["path"], "height", 1.0)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -5171,7 +7528,8 @@ class FullScreenViewer(QWidget):
         if hasattr(self, "fade_overlay"):
             self.fade_overlay.setGeometry(self.rect())
         if self.main_layout.currentWidget() == self.scroll_area:
-            self.load_image()
+            # 모니터 이동/해상도 변경 시 연속으로 오는 리사이즈를 한 번의 렌더로 병합
+            self._schedule_render(reset_zoom=True)
         if self.main_layout.currentWidget() == self.logo_screen_widget and hasattr(
             self, "logo_pixmap_original"
         ):
@@ -5325,19 +7683,19 @@ class FullScreenViewer(QWidget):
         elif event.modifiers() == Qt.ControlModifier:
             if event.key() == Qt.Key_Plus:
                 self.zoom = min(2.0, self.zoom + 0.1)
-                self.load_image_with_current_zoom()
+                self._schedule_render()
             elif event.key() == Qt.Key_Minus:
                 self.zoom = max(0.1, self.zoom - 0.1)
-                self.load_image_with_current_zoom()
+                self._schedule_render()
         elif event.key() == Qt.Key_Plus:
             self.zoom = min(2.0, self.zoom + 0.1)
-            self.load_image_with_current_zoom()
+            self._schedule_render()
         elif event.key() == Qt.Key_Minus:
             self.zoom = max(0.1, self.zoom - 0.1)
-            self.load_image_with_current_zoom()
+            self._schedule_render()
         elif event.key() == Qt.Key_Asterisk:
             self.zoom = 1.0
-            self.load_image_with_current_zoom()
+            self._schedule_render()
         elif event.key() == Qt.Key_0:
             self.fit_to_height()
 
@@ -5375,7 +7733,7 @@ class FullScreenViewer(QWidget):
                     self.zoom = min(2.0, self.zoom + 0.1)
                 else:
                     self.zoom = max(0.1, self.zoom - 0.1)
-                self.load_image_with_current_zoom()
+                self._schedule_render()
                 return True
             else:
                 v_scroll_bar = self.scroll_area.verticalScrollBar()